@@ -3,71 +3,144 @@
 Quick utility to decrypt Python wallet and show contents for migration
 """
 
+import ctypes
+import hashlib
+import hmac
 import json
+import mmap
+import os
 import sys
 import getpass
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-from cryptography.hazmat.primitives import hashes, hmac
-from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
-from cryptography.hazmat.backends import default_backend
-import secrets
-
-def decrypt_wallet_file(file_path, password):
-    """Decrypt Python wallet file and return wallet data"""
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+    _json_loads = json.loads
+
+# PBKDF2 work factor used by the Python wallet unless the envelope says otherwise
+DEFAULT_KDF_ITERATIONS = 390000
+MAX_KDF_ITERATIONS = 10_000_000
+
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+
+def _envelope_is_well_formed(envelope, iterations):
+    """Cheap shape check: 16-byte salt/nonce, 32-byte MAC, even-length hex ciphertext"""
+    fields = (envelope.get('salt'), envelope.get('nonce'), envelope.get('ciphertext'), envelope.get('mac'))
+    if not all(isinstance(value, str) for value in fields):
+        return False
+    salt, nonce, ciphertext, mac = fields
+    if len(salt) != 32 or len(nonce) != 32 or len(mac) != 64 or len(ciphertext) % 2:
+        return False
+    if not 0 < iterations <= MAX_KDF_ITERATIONS:
+        return False
+    return all(_HEX_DIGITS.issuperset(value) for value in fields)
+
+def _read_envelope(file_path):
+    """Parse the JSON envelope straight from a read-only mapping of the file"""
+    with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if orjson is None:
+            return json.loads(mm.read())
+        with memoryview(mm) as view:
+            return orjson.loads(view)
+
+@contextmanager
+def _secure_bytes(data):
+    """Yield a mutable buffer holding data and zero it in place on exit"""
+    buf = data if isinstance(data, bytearray) else bytearray(data)
     try:
-        with open(file_path, 'r') as f:
-            envelope = json.load(f)
+        yield buf
+    finally:
+        if buf:
+            view = (ctypes.c_char * len(buf)).from_buffer(buf)
+            ctypes.memset(ctypes.addressof(view), 0, len(buf))
+            del view
+
+def _derive_key(password_bytes, salt, iterations):
+    """PBKDF2-SHA256 key derivation (not memoized: the key must not outlive the decrypt)"""
+    return hashlib.pbkdf2_hmac('sha256', password_bytes, salt, iterations, dklen=32)
+
+def decrypt_wallet_file(file_path, password, iterations=None):
+    """Decrypt Python wallet file and return wallet data"""
+    # Deferred so the "file not found" path doesn't pay for loading cryptography
+    from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 
-        # Parse components
-        salt = bytes.fromhex(envelope['salt'])
-        nonce = bytes.fromhex(envelope['nonce'])
-        ciphertext = bytes.fromhex(envelope['ciphertext'])
-        provided_mac = envelope['mac']
-
-        # Derive key using PBKDF2-SHA256
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=salt,
-            iterations=390000,
-            backend=default_backend()
-        )
-        key = kdf.derive(password.encode('utf-8'))
+    try:
+        envelope = _read_envelope(file_path)
 
-        # Verify MAC
-        mac_data = salt + nonce + ciphertext
-        h = hmac.HMAC(key, hashes.SHA256(), backend=default_backend())
-        h.update(mac_data)
-        calculated_mac = h.finalize().hex()
+        iterations = int(iterations or envelope.get('iterations', DEFAULT_KDF_ITERATIONS))
 
-        if calculated_mac != provided_mac:
-            print("ERROR: Invalid password or corrupted wallet file")
+        # Reject malformed envelopes before paying for the KDF
+        if not _envelope_is_well_formed(envelope, iterations):
+            print("ERROR: Malformed wallet envelope")
             return None
 
-        # Generate HMAC key for decryption
-        h2 = hmac.HMAC(key, hashes.SHA256(), backend=default_backend())
-        h2.update(nonce)
-        hmac_key = h2.finalize()
-
-        # Decrypt using AES-CTR
-        cipher = Cipher(
-            algorithms.AES(hmac_key),
-            modes.CTR(nonce),
-            backend=default_backend()
-        )
-        decryptor = cipher.decryptor()
-        plaintext = decryptor.update(ciphertext) + decryptor.finalize()
-
-        # Parse JSON
-        wallet_data = json.loads(plaintext.decode('utf-8'))
+        # Parse components
+        # The MAC covers salt || nonce || ciphertext, so decode them as one blob
+        salt_len = len(envelope['salt']) // 2
+        nonce_end = salt_len + len(envelope['nonce']) // 2
+        blob = bytes.fromhex(envelope['salt'] + envelope['nonce'] + envelope['ciphertext'])
+        salt = blob[:salt_len]
+        nonce = blob[salt_len:nonce_end]
+        ciphertext = memoryview(blob)[nonce_end:]
+        provided_mac = bytes.fromhex(envelope['mac'])
+
+        # Derive key using PBKDF2-SHA256 (OpenSSL C implementation via hashlib)
+        with _secure_bytes(_derive_key(password.encode('utf-8'), salt, iterations)) as key:
+            # Key the HMAC once; copies reuse the ipad/opad state
+            base_mac = hmac.new(key, digestmod='sha256')
+
+            # Verify MAC
+            h = base_mac.copy()
+            h.update(blob)
+            calculated_mac = h.digest()
+
+            if not hmac.compare_digest(calculated_mac, provided_mac):
+                print("ERROR: Invalid password or corrupted wallet file")
+                return None
+
+            # Generate HMAC key for decryption
+            h2 = base_mac.copy()
+            h2.update(nonce)
+
+            # update_into needs room for one extra block minus a byte
+            with _secure_bytes(h2.digest()) as hmac_key, \
+                    _secure_bytes(bytearray(len(ciphertext) + 15)) as plaintext:
+                # Decrypt using AES-CTR
+                cipher = Cipher(algorithms.AES(hmac_key), modes.CTR(nonce))
+                decryptor = cipher.decryptor()
+                n = decryptor.update_into(ciphertext, plaintext)
+                decryptor.finalize()  # CTR is a stream mode; nothing is buffered
+                del plaintext[n:]
+
+                # Parse JSON
+                wallet_data = _json_loads(plaintext)
         return wallet_data
 
     except Exception as e:
         print(f"ERROR: Failed to decrypt wallet: {e}")
         return None
 
+def decrypt_many(file_paths, password):
+    """Decrypt several wallet files in parallel and map each path to its data (or None)"""
+    # hashlib.pbkdf2_hmac releases the GIL, so the KDFs genuinely run concurrently
+    paths = list(file_paths)
+    if not paths:
+        return {}
+    workers = min(len(paths), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(lambda path: decrypt_wallet_file(path, password), paths)
+        return dict(zip(paths, results))
+
 def main():
-    wallet_file = "/Users/beast/Library/Application Support/xrp-wallet-manager/wallets.enc.python"
+    # Optional path argument so the tool can be scripted without editing it
+    if len(sys.argv) > 1:
+        wallet_file = sys.argv[1]
+    else:
+        wallet_file = "/Users/beast/Library/Application Support/xrp-wallet-manager/wallets.enc.python"
 
     if not os.path.exists(wallet_file):
         print(f"Wallet file not found: {wallet_file}")
@@ -78,19 +151,24 @@ def main():
     wallet_data = decrypt_wallet_file(wallet_file, password)
 
     if wallet_data:
-        print("\n=== WALLET DATA SUCCESSFULLY DECRYPTED ===")
-        print(json.dumps(wallet_data, indent=2))
-        print("\n=== END WALLET DATA ===")
+        # Serialize once and emit the report with a single write
+        pretty = json.dumps(wallet_data, indent=2)
+        sys.stdout.write(
+            "\n=== WALLET DATA SUCCESSFULLY DECRYPTED ===\n"
+            + pretty
+            + "\n\n=== END WALLET DATA ===\n"
+        )
 
         # Save to a readable file
         output_file = "/Users/beast/xrp_wallet_manager/wallet_export.json"
         with open(output_file, 'w') as f:
-            json.dump(wallet_data, f, indent=2)
-        print(f"\nWallet data exported to: {output_file}")
-        print("You can now import this data into the Electron app.")
+            f.write(pretty)
+        sys.stdout.write(
+            f"\nWallet data exported to: {output_file}\n"
+            "You can now import this data into the Electron app.\n"
+        )
     else:
         print("Failed to decrypt wallet. Please check your password.")
 
 if __name__ == "__main__":
-    import os
     main()
\ No newline at end of file
@@ -3,24 +3,138 @@ Modern XRP Wallet Manager GUI
 Enhanced interface with multi-wallet support and beautiful styling
 """
 
-import base64
 import hashlib
 import hmac
+import io
+import itertools
 import json
+import operator
+import os
+import re
 import secrets
 import threading
+import time
 import tkinter as tk
+import traceback
 import webbrowser
+from binascii import a2b_base64, b2a_base64
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from queue import Empty, Queue
+from queue import Empty, Queue, SimpleQueue
 from tkinter import filedialog, messagebox, scrolledtext, simpledialog, ttk
-from typing import Dict, List, Optional
+from tkinter import font as tkfont
+from typing import Callable, Dict, List, Optional
 
 import requests
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from xrpl.core.addresscodec import is_valid_classic_address
+
+try:
+    # Hoists the HMAC key schedule out of the iteration loop; same signature as hashlib
+    from fastpbkdf2 import pbkdf2_hmac
+except ImportError:
+    from hashlib import pbkdf2_hmac
+
+try:
+    import orjson
+
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    _json_loads = json.loads
+
+try:
+    # Renders receive QR codes locally so addresses never leave the machine
+    import segno
+except ImportError:
+    segno = None
 
 from xrp_wallet import SecretInfo, XRPWalletManager, create_wallet_from_secret
 
+# Notebook tab labels; spacing comes from the TNotebook.Tab padding style
+TAB_WALLET = "💼 Wallet"
+TAB_SEND = "💸 Send"
+TAB_RECEIVE = "📥 Receive"
+TAB_HISTORY = "📊 History"
+TAB_MULTISIG = "🔐 Multi-Sig"
+
+# Draft signer entries always carry an integer weight (dialog and ledger load set it)
+_signer_account_weight = operator.itemgetter('address', 'weight')
+
+# Attributes owned by the wallet interface (header, notebook and its tabs)
+INTERFACE_ATTRS = (
+    "notebook", "wallet_frame", "send_frame", "receive_frame", "history_frame",
+    "multisig_frame", "_deferred_tabs",
+    "address_var", "balance_var", "network_text",
+    "dest_var", "dest_tag_var", "amount_var", "memo_var", "send_balance_var", "result_text",
+    "receive_address_var", "receive_status_var", "receive_qr_label",
+    "history_list", "history_detail_text", "history_status_var", "history_summary_var",
+    "limit_var", "history_records", "history_index", "history_scroll", "history_rendered",
+    "history_marker", "history_address",
+    "multisig_status_tree", "multisig_status_var", "multisig_signer_tree",
+    "multisig_new_quorum_var", "multisig_cost_var", "multisig_dest_var",
+    "multisig_dest_tag_var", "multisig_amount_var", "multisig_memo_var",
+    "multisig_tx_preview", "multisig_tx_status_var", "multisig_signing_tree",
+    "multisig_signing_status_var", "multisig_apply_button", "multisig_sign_button",
+    "multisig_submit_button",
+)
+
+# Destination tags are unsigned 32-bit integers written as plain ASCII digits
+_UINT32_RE = re.compile(r"[0-9]{1,10}")
+_UINT32_MAX = 0xFFFFFFFF
+
+
+def _parse_destination_tag(text: str) -> Optional[int]:
+    """Return text as a destination tag, or None if it is not a valid uint32."""
+    if not _UINT32_RE.fullmatch(text):
+        return None
+    value = int(text)
+    return value if value <= _UINT32_MAX else None
+
+
+# Seconds a fetched wallet-list balance is reused before asking the ledger again
+BALANCE_CACHE_TTL = 5.0
+
+# Account page per network; anything else falls back to xrpscan
+EXPLORER_ACCOUNT_URLS = {
+    "mainnet": "https://livenet.xrpl.org/accounts/{}",
+    "testnet": "https://testnet.xrpl.org/accounts/{}",
+    "devnet": "https://devnet.xrpl.org/accounts/{}",
+}
+DEFAULT_EXPLORER_ACCOUNT_URL = "https://xrpscan.com/account/{}"
+# Transaction page per network; anything other than mainnet uses the testnet explorer
+EXPLORER_TX_URLS = {
+    "mainnet": "https://livenet.xrpl.org/transactions/{}",
+}
+DEFAULT_EXPLORER_TX_URL = "https://testnet.xrpl.org/transactions/{}"
+
+# Transactions requested per account_tx page
+HISTORY_PAGE_SIZE = 50
+
+# History rows inserted into the Treeview per scroll step; the rest stay in history_records
+HISTORY_RENDER_CHUNK = 50
+
+# Worker-result queue polling: delay while busy / idle, and callbacks run per tick
+UI_QUEUE_BUSY_MS = 10
+UI_QUEUE_IDLE_MS = 100
+UI_QUEUE_BATCH = 64
+
+# Quiet period before a burst of ledger refresh requests runs once
+REFRESH_DEBOUNCE_MS = 250
+
+# Receive-tab QR codes: pixel size requested, and how many images to keep
+QR_SIZE_PX = 240
+QR_CACHE_SIZE = 16
+
 
 class ModernStyle:
     """Modern color scheme and styling constants"""
@@ -49,6 +163,32 @@ class ModernStyle:
     FONT_LARGE = ("SF Pro Display", 14, "bold")
     FONT_MONO = ("SF Mono", 9)
 
+    # Named fonts must stay referenced; Tk deletes them when the Font is collected
+    _named_fonts: Dict[str, tkfont.Font] = {}
+
+    @classmethod
+    def register_fonts(cls, root):
+        """Resolve each font once as a named Tk font and point FONT_* at its name.
+
+        Widgets then share the already-resolved font instead of parsing the
+        (family, size, style) tuple every time one is created.
+        """
+        for attr in ("FONT_MAIN", "FONT_HEADING", "FONT_LARGE", "FONT_MONO"):
+            spec = getattr(cls, attr)
+            if not isinstance(spec, tuple):
+                continue  # already registered
+            family, size, *style = spec
+            named = tkfont.Font(
+                root=root,
+                name=f"XRPWallet{attr.title().replace('_', '')}",
+                family=family,
+                size=size,
+                weight="bold" if "bold" in style else "normal",
+                exists=False,
+            )
+            cls._named_fonts[attr] = named
+            setattr(cls, attr, named.name)
+
 
 class WalletData:
     """Data class for wallet information"""
@@ -103,12 +243,35 @@ class MultiWalletManager:
         self.legacy_file = self.storage_dir / "wallets.json"
 
         self.password: Optional[str] = None
-        self.kdf_iterations = 390000
+        # New stores use memory-hard scrypt; PBKDF2 envelopes are still readable
+        self.kdf_params: Dict[str, object] = {"name": "scrypt", "n": 2 ** 15, "r": 8, "p": 1}
         self.initialized = False
 
+        # Keys derived for the current salt, reused across saves in this session
+        self._cached_salt: Optional[bytes] = None
+        self._cached_keys: Optional[tuple[bytes, bytes]] = None
+        # AEAD cipher keyed with the cached enc_key
+        self._aead: Optional[AESGCM] = None
+        self._key_lock = threading.Lock()
+
+        # Encryption and disk writes happen on a background writer thread
+        self._save_queue: Queue = Queue()
+        self._save_thread: Optional[threading.Thread] = None
+        # Decoded envelope kept between unlock attempts
+        self._envelope_cache: Optional[Dict[str, object]] = None
+        # Digest of the last payload queued for writing, to skip no-op saves
+        self._last_payload_digest: Optional[bytes] = None
+        # Last background write failure not yet reported, and a hook the writer
+        # thread calls when one occurs (the GUI marshals it onto the Tk thread)
+        self._save_error: Optional[Exception] = None
+        self._save_error_lock = threading.Lock()
+        self.on_save_error: Optional[Callable[[], None]] = None
+        # Set once the store is known to be on disk so later checks skip the stat()
+        self._store_exists = False
+
     def has_encrypted_data(self) -> bool:
         """Return True if an encrypted wallet store already exists."""
-        return self.encrypted_file.exists()
+        return self._store_exists or self.encrypted_file.exists()
 
     def ensure_initialized(self):
         """Ensure the manager has been unlocked with a master password."""
@@ -124,7 +287,16 @@ class MultiWalletManager:
             raise ValueError("Password must be at least 8 characters long.")
 
         if self.initialized:
-            self.password = password
+            with self._key_lock:
+                rekey = password != self.password
+                if rekey:
+                    self._cached_salt = None
+                    self._cached_keys = None
+                    self._aead = None
+                self.password = password
+            if rekey:
+                # An unchanged payload must still be rewritten under the new password
+                self._last_payload_digest = None
             return
 
         if self.encrypted_file.exists():
@@ -134,7 +306,42 @@ class MultiWalletManager:
             self.initialized = True
             if self.legacy_file.exists():
                 self._load_legacy_store()
-            self.save_wallets()
+            try:
+                self.save_wallets(wait=True)
+            except Exception:
+                # Nothing reached disk; the next attempt must create the store again
+                self.initialized = False
+                self.password = None
+                self._last_payload_digest = None
+                raise
+
+    def change_master_password(self, old_password: str, new_password: str):
+        """Re-key the store under a new master password with a fresh salt."""
+        self.ensure_initialized()
+        if not hmac.compare_digest(
+            (old_password or "").strip().encode("utf-8"), self.password.encode("utf-8")
+        ):
+            raise ValueError("Current master password is incorrect.")
+        new_password = (new_password or "").strip()
+        if len(new_password) < 8:
+            raise ValueError("Password must be at least 8 characters long.")
+
+        old_password = self.password
+        self._rekey(new_password)
+        try:
+            self.save_wallets(wait=True)
+        except Exception:
+            # The store on disk is still under the old password
+            self._rekey(old_password)
+            raise
+
+    def _rekey(self, password: str):
+        with self._key_lock:
+            self.password = password
+            self._cached_salt = None
+            self._cached_keys = None
+            self._aead = None
+        self._last_payload_digest = None
 
     def _load_legacy_store(self):
         """Load legacy plaintext storage and re-encrypt it."""
@@ -151,54 +358,84 @@ class MultiWalletManager:
                 pass
 
     def _derive_keys(
-        self, password: str, salt: bytes, iterations: int
+        self, password: str, salt: bytes, kdf: Dict[str, object]
     ) -> tuple[bytes, bytes]:
         """Derive encryption and authentication keys from the password."""
-        derived = hashlib.pbkdf2_hmac(
-            "sha256", password.encode("utf-8"), salt, iterations, dklen=64
-        )
+        if kdf.get("name") == "scrypt":
+            n, r, p = int(kdf["n"]), int(kdf["r"]), int(kdf["p"])
+            derived = hashlib.scrypt(
+                password.encode("utf-8"),
+                salt=salt,
+                n=n,
+                r=r,
+                p=p,
+                maxmem=256 * n * r * p,
+                dklen=64,
+            )
+        else:
+            iterations = int(kdf.get("iterations", 390000))
+            derived = pbkdf2_hmac(
+                "sha256", password.encode("utf-8"), salt, iterations, dklen=64
+            )
         return derived[:32], derived[32:]
 
+    def _aes_ctr(self, key: bytes, nonce: bytes, data: bytes) -> bytes:
+        """Encrypt/decrypt data with AES-256-CTR (OpenSSL, AES-NI when available)."""
+        cryptor = Cipher(algorithms.AES(key), modes.CTR(nonce)).encryptor()
+        return cryptor.update(data) + cryptor.finalize()
+
     def _stream_cipher(self, key: bytes, nonce: bytes, data: bytes) -> bytes:
-        """Encrypt/decrypt data using an HMAC-SHA256-based stream cipher."""
+        """Encrypt/decrypt data using the legacy (version 1) HMAC-SHA256 stream cipher."""
         block_size = hashlib.sha256().digest_size
-        output = bytearray()
-        counter = 0
+        length = len(data)
+        block_count = (length + block_size - 1) // block_size
+
+        # Key the HMAC and absorb the nonce once; each block only adds its counter
+        prototype = hmac.new(key, nonce, hashlib.sha256)
 
-        while len(output) < len(data):
-            counter_bytes = counter.to_bytes(8, "big")
-            keystream = hmac.new(key, nonce + counter_bytes, hashlib.sha256).digest()
-            chunk = data[len(output) : len(output) + block_size]
-            output.extend(bytes(a ^ b for a, b in zip(chunk, keystream)))
-            counter += 1
+        # Build the whole keystream first, then XOR it against the data in one pass
+        keystream = bytearray(block_count * block_size)
+        for counter in range(block_count):
+            ctx = prototype.copy()
+            ctx.update(counter.to_bytes(8, "big"))
+            offset = counter * block_size
+            keystream[offset : offset + block_size] = ctx.digest()
+        del keystream[length:]
 
-        return bytes(output)
+        xor = int.from_bytes(data, "big") ^ int.from_bytes(keystream, "big")
+        return xor.to_bytes(length, "big")
 
     def _encrypt_payload(self, payload: Dict[str, Dict]) -> Dict[str, object]:
         """Encrypt payload into a JSON-friendly envelope."""
         self.ensure_initialized()
-        salt = secrets.token_bytes(16)
-        nonce = secrets.token_bytes(16)
-        enc_key, mac_key = self._derive_keys(self.password, salt, self.kdf_iterations)
+        with self._key_lock:
+            if self._cached_salt is None or self._cached_keys is None:
+                self._cached_salt = secrets.token_bytes(16)
+                self._cached_keys = self._derive_keys(
+                    self.password, self._cached_salt, self.kdf_params
+                )
+                self._aead = AESGCM(self._cached_keys[0])
+            salt = self._cached_salt
+            aead = self._aead
+        nonce = secrets.token_bytes(12)
 
-        plaintext = json.dumps(payload).encode("utf-8")
-        ciphertext = self._stream_cipher(enc_key, nonce, plaintext)
-        mac = hmac.new(mac_key, nonce + ciphertext, hashlib.sha256).digest()
+        # Single authenticated pass; the 16-byte tag is appended to the ciphertext
+        ciphertext = aead.encrypt(nonce, _json_dumps(payload), None)
 
         return {
-            "version": 1,
-            "salt": base64.b64encode(salt).decode("utf-8"),
-            "kdf": {
-                "name": "pbkdf2_sha256",
-                "iterations": self.kdf_iterations,
-            },
-            "nonce": base64.b64encode(nonce).decode("utf-8"),
-            "mac": base64.b64encode(mac).decode("utf-8"),
-            "ciphertext": base64.b64encode(ciphertext).decode("utf-8"),
+            "version": 3,
+            "cipher": "aes-256-gcm",
+            "salt": b2a_base64(salt, newline=False).decode("ascii"),
+            "kdf": dict(self.kdf_params),
+            "nonce": b2a_base64(nonce, newline=False).decode("ascii"),
+            "ciphertext": b2a_base64(ciphertext, newline=False).decode("ascii"),
         }
 
-    def _load_encrypted_store(self, password: str):
-        """Load wallets from encrypted storage using the provided password."""
+    def _parse_envelope(self) -> Dict[str, object]:
+        """Read and decode the on-disk envelope once; password retries reuse it."""
+        if self._envelope_cache is not None:
+            return self._envelope_cache
+
         try:
             with open(self.encrypted_file, "r", encoding="utf-8") as f:
                 envelope = json.load(f)
@@ -206,26 +443,60 @@ class MultiWalletManager:
             raise ValueError(f"Unable to read wallet storage: {exc}") from exc
 
         try:
-            salt = base64.b64decode(envelope["salt"])
-            iterations = envelope.get("kdf", {}).get("iterations", self.kdf_iterations)
-            nonce = base64.b64decode(envelope["nonce"])
-            ciphertext = base64.b64decode(envelope["ciphertext"])
-            mac = base64.b64decode(envelope["mac"])
+            self._envelope_cache = {
+                "version": envelope.get("version", 1),
+                "salt": a2b_base64(envelope["salt"]),
+                "kdf": envelope.get("kdf") or {"name": "pbkdf2_sha256", "iterations": 390000},
+                "nonce": a2b_base64(envelope["nonce"]),
+                "ciphertext": a2b_base64(envelope["ciphertext"]),
+                # Version 3 envelopes carry the AEAD tag inside the ciphertext
+                "mac": a2b_base64(envelope["mac"]) if "mac" in envelope else None,
+            }
         except KeyError as exc:
             raise ValueError("Wallet storage file is corrupted.") from exc
+        return self._envelope_cache
 
-        enc_key, mac_key = self._derive_keys(password, salt, iterations)
-        expected_mac = hmac.new(mac_key, nonce + ciphertext, hashlib.sha256).digest()
+    def _load_encrypted_store(self, password: str):
+        """Load wallets from encrypted storage using the provided password."""
+        envelope = self._parse_envelope()
+        salt = envelope["salt"]
+        kdf = envelope["kdf"]
+        nonce = envelope["nonce"]
+        ciphertext = envelope["ciphertext"]
+        mac = envelope["mac"]
 
-        if not hmac.compare_digest(mac, expected_mac):
-            raise ValueError("Incorrect password or corrupted wallet storage.")
+        enc_key, mac_key = self._derive_keys(password, salt, kdf)
+        aead = AESGCM(enc_key)
 
-        plaintext = self._stream_cipher(enc_key, nonce, ciphertext)
+        if envelope["version"] >= 3:
+            try:
+                plaintext = aead.decrypt(nonce, ciphertext, None)
+            except InvalidTag as exc:
+                raise ValueError("Incorrect password or corrupted wallet storage.") from exc
+        else:
+            # Legacy encrypt-then-MAC envelopes (versions 1 and 2)
+            mac_ctx = hmac.new(mac_key, digestmod=hashlib.sha256)
+            mac_ctx.update(nonce)
+            mac_ctx.update(ciphertext)
+            if mac is None or not hmac.compare_digest(mac, mac_ctx.digest()):
+                raise ValueError("Incorrect password or corrupted wallet storage.")
+
+            if envelope["version"] >= 2:
+                plaintext = self._aes_ctr(enc_key, nonce, ciphertext)
+            else:
+                plaintext = self._stream_cipher(enc_key, nonce, ciphertext)
 
-        payload = json.loads(plaintext.decode("utf-8"))
+        payload = _json_loads(plaintext)
+        self._envelope_cache = None
+        self._store_exists = True
         self.password = password
-        self.kdf_iterations = iterations
         self.initialized = True
+        if kdf.get("name") == self.kdf_params["name"]:
+            # Keep the store's salt and keys so saves this session skip the KDF
+            self.kdf_params = dict(kdf)
+            self._cached_salt = salt
+            self._cached_keys = (enc_key, mac_key)
+            self._aead = aead
         self._load_from_payload(payload)
 
     def _load_from_payload(self, payload: Dict[str, Dict]):
@@ -243,34 +514,42 @@ class MultiWalletManager:
             network = record.get("network", "testnet")
             public_key = record.get("public_key") or None
             algorithm = record.get("algorithm") or None
+            address = record.get("address") or None
 
-            try:
-                wallet, secret_info = create_wallet_from_secret(
+            if public_key and algorithm and address:
+                # Everything the list needs is stored; keys are derived on first use
+                wallet_data = WalletData(
+                    name,
                     secret,
+                    network,
+                    secret_type=record.get("secret_type", "seed"),
                     public_key=public_key,
-                    algorithm_hint=algorithm,
+                    algorithm=algorithm,
                 )
-            except Exception as exc:
-                print(f"Skipping wallet '{name}': {exc}")
-                continue
+                wallet_data.address = address
+            else:
+                # Older records lack the cached key material, so derive it once here
+                try:
+                    wallet, secret_info = create_wallet_from_secret(
+                        secret, public_key=public_key, algorithm_hint=algorithm
+                    )
+                except Exception as exc:
+                    print(f"Skipping wallet '{name}': {exc}")
+                    continue
 
-            wallet_data = WalletData(
-                name,
-                secret_info.secret,
-                network,
-                secret_type=record.get("secret_type", secret_info.secret_type),
-                public_key=secret_info.public_key,
-                algorithm=secret_info.algorithm.value,
-            )
-            wallet_data.address = record.get("address", wallet.address)
-            wallet_data.balance = record.get("balance", wallet_data.balance)
+                wallet_data = WalletData(
+                    name,
+                    secret_info.secret,
+                    network,
+                    secret_type=record.get("secret_type", secret_info.secret_type),
+                    public_key=secret_info.public_key,
+                    algorithm=secret_info.algorithm.value,
+                )
+                wallet_data.address = address or wallet.address
+                self.secret_cache[name] = secret_info
 
+            wallet_data.balance = record.get("balance", wallet_data.balance)
             self.wallets[name] = wallet_data
-            self.secret_cache[name] = secret_info
-
-            manager = XRPWalletManager(network=network)
-            manager.use_wallet(wallet, secret_info)
-            self.wallet_managers[name] = manager
 
         self.active_wallet = payload.get("active_wallet")
         for data in self.wallets.values():
@@ -279,6 +558,8 @@ class MultiWalletManager:
         if self.active_wallet in self.wallets:
             active = self.wallets[self.active_wallet]
             active.is_active = True
+            # Other wallets get their manager on first use via get_or_create_manager
+            self.get_or_create_manager(self.active_wallet)
         else:
             self.active_wallet = None
 
@@ -303,10 +584,9 @@ class MultiWalletManager:
             if wallet is None or info is None:
                 raise ValueError("Unable to construct wallet from provided secret")
 
+            # The constructor already configures the client for this network
             manager = XRPWalletManager(network=network)
             manager.use_wallet(wallet, info)
-            manager.network = network
-            manager.setup_client()
 
             wallet_data = WalletData(
                 name,
@@ -318,24 +598,42 @@ class MultiWalletManager:
             )
             wallet_data.address = wallet.address
 
-            self.wallets[name] = wallet_data
-            self.wallet_managers[name] = manager
-            self.secret_cache[name] = info
-
-            self.save_wallets()
-            return True
-
         except Exception as exc:
             print(f"Error adding wallet '{name}': {exc}")
-            import traceback
-
             traceback.print_exc()
             return False
 
+        previous = (
+            self.wallets.get(name), self.wallet_managers.get(name), self.secret_cache.get(name)
+        )
+        self.wallets[name] = wallet_data
+        self.wallet_managers[name] = manager
+        self.secret_cache[name] = info
+        try:
+            self.save_wallets(wait=True)
+        except Exception as exc:
+            # Not on disk, so don't keep it in memory either
+            self._restore_wallet_entry(name, previous)
+            print(f"Error saving wallet '{name}': {exc}")
+            return False
+        return True
+
+    def _restore_wallet_entry(self, name: str, entry: tuple):
+        """Put back (wallet data, manager, secret info) for name, or drop it if all are None."""
+        for store, value in zip((self.wallets, self.wallet_managers, self.secret_cache), entry):
+            if value is None:
+                store.pop(name, None)
+            else:
+                store[name] = value
+
     def remove_wallet(self, name: str) -> bool:
         """Remove a wallet."""
         self.ensure_initialized()
         if name in self.wallets:
+            previous = (
+                self.wallets[name], self.wallet_managers.get(name), self.secret_cache.get(name)
+            )
+            previous_active = self.active_wallet
             if self.active_wallet == name:
                 self.active_wallet = None
 
@@ -343,7 +641,14 @@ class MultiWalletManager:
             self.wallet_managers.pop(name, None)
             del self.wallets[name]
 
-            self.save_wallets()
+            try:
+                self.save_wallets(wait=True)
+            except Exception:
+                # Still on disk; keep showing it rather than letting it reappear on restart
+                self._restore_wallet_entry(name, previous)
+                self.active_wallet = previous_active
+                self._last_payload_digest = None
+                raise
             return True
         return False
 
@@ -380,6 +685,11 @@ class MultiWalletManager:
             return None
 
         wallet_data = self.wallets[name]
+        manager = self.wallet_managers.get(name)
+        if manager is not None and manager.wallet is not None and manager.network == wallet_data.network:
+            # Already bound to this wallet's key and client; nothing to rebuild
+            return manager
+
         secret_info = self.secret_cache.get(name)
         if not secret_info:
             wallet, secret_info = create_wallet_from_secret(
@@ -391,7 +701,6 @@ class MultiWalletManager:
         else:
             wallet = secret_info.make_wallet()
 
-        manager = self.wallet_managers.get(name)
         if manager is None:
             manager = XRPWalletManager(network=wallet_data.network)
             self.wallet_managers[name] = manager
@@ -407,36 +716,101 @@ class MultiWalletManager:
             return self.wallets[self.active_wallet]
         return None
 
-    def save_wallets(self):
-        """Persist wallet configurations securely."""
+    def save_wallets(self, wait: bool = False):
+        """Snapshot wallet configurations and queue them for encrypted persistence.
+
+        With wait=True, block until the write finishes and raise if it failed.
+        """
         self.ensure_initialized()
 
         wallet_configs: Dict[str, Dict[str, str]] = {}
         for name, wallet in self.wallets.items():
-            secret_info = self.secret_cache.get(name)
-            if not secret_info:
+            if not (wallet.public_key and wallet.algorithm):
                 _, secret_info = create_wallet_from_secret(
                     wallet.secret,
-                    public_key=wallet.public_key,
-                    algorithm_hint=wallet.algorithm,
+                    public_key=wallet.public_key or None,
+                    algorithm_hint=wallet.algorithm or None,
                 )
                 self.secret_cache[name] = secret_info
-
-            record = wallet.to_record()
-            record["public_key"] = secret_info.public_key
-            record["algorithm"] = secret_info.algorithm.value
-            wallet_configs[name] = record
+                wallet.public_key = secret_info.public_key
+                wallet.algorithm = secret_info.algorithm.value
+            wallet_configs[name] = wallet.to_record()
 
         payload = {
             "wallets": wallet_configs,
             "active_wallet": self.active_wallet,
-            "address_book": self.address_book,
+            "address_book": list(self.address_book),
         }
+        digest = hashlib.sha256(
+            json.dumps(payload, sort_keys=True).encode("utf-8")
+        ).digest()
+        if digest != self._last_payload_digest:
+            self._last_payload_digest = digest
+            self._save_queue.put(payload)
+            if self._save_thread is None or not self._save_thread.is_alive():
+                self._save_thread = threading.Thread(target=self._save_worker, daemon=True)
+                self._save_thread.start()
+        if wait:
+            self.flush_pending_saves()
+
+    def flush_pending_saves(self):
+        """Block until every queued save has been written; raise the last failure, if any."""
+        self._save_queue.join()
+        error = self.take_save_error()
+        if error is not None:
+            raise error
+
+    def take_save_error(self) -> Optional[Exception]:
+        """Return and clear the last unreported background write failure."""
+        with self._save_error_lock:
+            error, self._save_error = self._save_error, None
+        return error
+
+    def _save_worker(self):
+        """Write queued payloads, coalescing bursts so only the latest is written."""
+        while True:
+            payload = self._save_queue.get()
+            pending = 1
+            try:
+                while True:
+                    payload = self._save_queue.get_nowait()
+                    pending += 1
+            except Empty:
+                pass
+
+            failed = False
+            try:
+                self._write_store(payload)
+            except Exception as exc:
+                # Forget the digest so the next save retries instead of being skipped
+                self._last_payload_digest = None
+                print(f"Failed to save wallets: {exc}")
+                failed = True
+                with self._save_error_lock:
+                    self._save_error = exc
+            else:
+                # The latest state is on disk; an earlier failure no longer matters
+                with self._save_error_lock:
+                    self._save_error = None
+            finally:
+                for _ in range(pending):
+                    self._save_queue.task_done()
+            if failed and self.on_save_error is not None:
+                self.on_save_error()
+
+    def _write_store(self, payload: Dict[str, object]):
+        """Encrypt payload and atomically replace the wallet store on disk."""
         envelope = self._encrypt_payload(payload)
 
         self.storage_dir.mkdir(exist_ok=True)
-        with open(self.encrypted_file, "w", encoding="utf-8") as f:
-            json.dump(envelope, f, indent=2)
+        tmp_file = self.encrypted_file.with_name(self.encrypted_file.name + ".tmp")
+        with open(tmp_file, "wb") as f:
+            f.write(_json_dumps(envelope))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.encrypted_file)
+        self._envelope_cache = None
+        self._store_exists = True
 
         if self.legacy_file.exists():
             try:
@@ -477,17 +851,55 @@ class ModernXRPWalletGUI:
 
     def __init__(self, root):
         self.root = root
-        self.ui_queue: Queue = Queue()
+        self.ui_queue: SimpleQueue = SimpleQueue()
+        # Long-lived workers for network and KDF calls; results return via ui_queue
+        self._io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="xrpl-io")
+        # Bulk balance refreshes get their own workers so they can't starve the pool above
+        self._balance_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="xrpl-balance")
         self.multi_wallet = MultiWalletManager()
-        self.wallet_balance_labels: Dict[str, tk.StringVar] = {}
-        self.receive_qr_cache: Dict[str, tk.PhotoImage] = {}
+        # Background write failures are surfaced on the Tk thread
+        self.multi_wallet.on_save_error = lambda: self.run_on_ui_thread(self._report_save_error)
+        # Interface widgets and variables stay None until their tab is built
+        self.__dict__.update(dict.fromkeys(INTERFACE_ATTRS))
+        self.wallet_balance_labels: Dict[str, ttk.Label] = {}
+        # Wallet name -> (monotonic time, display text) of the last successful fetch
+        self._balance_cache: Dict[str, tuple[float, str]] = {}
+        # Wallet name -> ((address, network), card) for the cards currently shown
+        self._wallet_cards: Dict[str, tuple[tuple[str, str], ttk.Frame]] = {}
+        # Built once per wallet list and shown/hidden rather than recreated
+        self._wallet_empty_frame: Optional[ttk.Frame] = None
+        self._wallet_empty_shown = False
+        # (address, size) -> QR image, least recently shown first
+        self.receive_qr_cache: "OrderedDict[tuple[str, int], tk.PhotoImage]" = OrderedDict()
+        self._qr_pending: set = set()
+        # webbrowser controller, looked up on the first explorer link
+        self._browser: Optional[webbrowser.BaseBrowser] = None
+        # Keep-alive connection to the QR API, only needed when segno is unavailable
+        self._qr_session: Optional[requests.Session] = None if segno is not None else requests.Session()
         self.receive_qr_image = None
         self.receive_last_address: Optional[str] = None
         self.multisig_session: Optional[Dict] = None
-        self.multisig_signer_entries: List[Dict] = []
+        # Draft signers keyed by their row id in the signer tree, in display order
+        self.multisig_signer_entries: Dict[str, Dict] = {}
         self.multisig_status: Dict[str, object] = {'enabled': False}
+        # Network -> server_info reserves used for signer-list cost previews
+        self._reserve_info: Dict[str, Dict] = {}
+        self._reserve_pending: set = set()
+        # Status-bar network probe, built on first use; one server_info call at a time
+        self._network_probe: Optional[XRPWalletManager] = None
+        self._network_status_pending = False
+        # Treeview path -> {iid: values} currently shown, maintained by _sync_tree
+        self._tree_rows: Dict[str, Dict[str, tuple]] = {}
+        self._signer_ids = itertools.count(1)
+        # Refresh requests made in one event-loop turn collapse into a single pass
+        self._list_refresh_pending = False
+        # Debounce key -> pending root.after id; bursts of ledger refreshes collapse into one
+        self._debounce_ids: Dict[str, str] = {}
 
         self.setup_modern_gui()
+        # One Tcl command per card action, shared by every wallet card
+        self._select_wallet_cmd = self.root.register(self.select_wallet)
+        self._remove_wallet_cmd = self.root.register(self.remove_wallet)
         self.root.after(50, self._process_ui_queue)
         self.setup_welcome_screen()
 
@@ -520,7 +932,12 @@ class ModernXRPWalletGUI:
                     continue
 
                 try:
-                    self.multi_wallet.initialize(password)
+                    self.run_with_progress(
+                        "Unlocking Wallets",
+                        "Unlocking wallets...",
+                        self.multi_wallet.initialize,
+                        password,
+                    )
                     return True
                 except ValueError as exc:
                     attempts_remaining -= 1
@@ -563,7 +980,12 @@ class ModernXRPWalletGUI:
                 continue
 
             try:
-                self.multi_wallet.initialize(password)
+                self.run_with_progress(
+                    "Creating Wallet Store",
+                    "Securing your wallet store...",
+                    self.multi_wallet.initialize,
+                    password,
+                )
                 messagebox.showinfo(
                     "Master Password Set",
                     "Master password created successfully. Keep it safe!",
@@ -572,12 +994,52 @@ class ModernXRPWalletGUI:
                 return True
             except ValueError as exc:
                 messagebox.showerror("Password Error", str(exc), parent=self.root)
+            except Exception as exc:
+                messagebox.showerror(
+                    "Save Failed", f"Could not create the wallet store:\n{exc}", parent=self.root
+                )
 
     def show_password_dialog(self, title: str, prompt: str, require_confirmation: bool = False) -> Optional[str]:
         dialog = PasswordDialog(self.root, title, prompt, require_confirmation)
         self.root.wait_window(dialog.dialog)
         return dialog.result
 
+    def run_with_progress(self, title: str, message: str, func, *args):
+        """Run a blocking call (e.g. the KDF) on a worker while Tk keeps servicing events."""
+        progress = tk.Toplevel(self.root)
+        progress.title(title)
+        progress.resizable(False, False)
+        progress.transient(self.root)
+        progress.protocol("WM_DELETE_WINDOW", lambda: None)
+
+        frame = ttk.Frame(progress, padding=20)
+        frame.pack(fill="both", expand=True)
+        ttk.Label(frame, text=message, style="Heading.TLabel").pack(anchor="w", pady=(0, 10))
+        bar = ttk.Progressbar(frame, mode="indeterminate", length=260)
+        bar.pack(fill="x")
+        bar.start(10)
+        progress.grab_set()
+
+        done = tk.BooleanVar(value=False)
+        outcome: Dict[str, object] = {}
+
+        def worker():
+            try:
+                outcome["result"] = func(*args)
+            except Exception as exc:
+                outcome["error"] = exc
+            self.run_on_ui_thread(done.set, True)
+
+        self._io_pool.submit(worker)
+        self.root.wait_variable(done)
+        bar.stop()
+        progress.grab_release()
+        progress.destroy()
+
+        if "error" in outcome:
+            raise outcome["error"]
+        return outcome.get("result")
+
     def setup_modern_gui(self):
         """Initialize the modern GUI with styling"""
         self.root.title("XRP Wallet Manager")
@@ -586,6 +1048,7 @@ class ModernXRPWalletGUI:
         self.root.configure(bg=ModernStyle.BG_PRIMARY)
 
         # Configure modern ttk styles
+        ModernStyle.register_fonts(self.root)
         self.setup_styles()
 
         # Create main container
@@ -683,6 +1146,9 @@ class ModernXRPWalletGUI:
                        relief="solid",
                        borderwidth=1)
 
+        # Notebook tabs: fixed padding instead of space-padded labels
+        style.configure("TNotebook.Tab", padding=(12, 6))
+
         # Modern label styles
         style.configure("Heading.TLabel",
                        font=ModernStyle.FONT_HEADING,
@@ -702,6 +1168,7 @@ class ModernXRPWalletGUI:
     def setup_welcome_screen(self):
         """Setup the welcome/wallet selection screen"""
         # Clear main container
+        self._release_interface_state()
         for widget in self.main_container.winfo_children():
             widget.destroy()
 
@@ -728,6 +1195,9 @@ class ModernXRPWalletGUI:
         # Wallet list
         self.wallet_list_frame = ttk.Frame(left_panel, style="Main.TFrame")
         self.wallet_list_frame.pack(fill="both", expand=True)
+        self._wallet_cards = {}
+        self._wallet_empty_frame = None
+        self._wallet_empty_shown = False
 
         self.refresh_wallet_list()
 
@@ -769,6 +1239,13 @@ class ModernXRPWalletGUI:
         # Load network info
         self.update_network_status()
 
+    @staticmethod
+    def _pin_label_column(grid: ttk.Frame, labels) -> None:
+        """Give a form's label column a fixed minimum width measured once."""
+        font = tkfont.nametofont(ModernStyle.FONT_MAIN)
+        width = max(font.measure(text) for text in labels)
+        grid.columnconfigure(0, minsize=width + 16)
+
     def create_card_frame(self, parent) -> ttk.Frame:
         """Create a modern card-style frame"""
         card = ttk.Frame(parent, style="Card.TFrame", padding=20)
@@ -807,53 +1284,75 @@ class ModernXRPWalletGUI:
         balance_value = (
             f"{wallet_data.balance} XRP" if wallet_data.balance not in ("", "Error") else wallet_data.balance or "Loading..."
         )
-        balance_var = tk.StringVar(value=balance_value)
+        # Write-only label: balance updates configure its text directly
         balance_label = ttk.Label(
-            balance_frame, textvariable=balance_var, style="Heading.TLabel"
+            balance_frame, text=balance_value, style="Heading.TLabel"
         )
         balance_label.pack(side="right")
-        self.wallet_balance_labels[wallet_data.name] = balance_var
+        self.wallet_balance_labels[wallet_data.name] = balance_label
 
         # Actions
         actions_frame = ttk.Frame(card, style="Main.TFrame")
         actions_frame.pack(fill="x")
 
+        # (tcl_command, name) becomes a Tcl script calling the shared command with the name
         ttk.Button(actions_frame, text="Select",
-                  command=lambda: self.select_wallet(wallet_data.name),
+                  command=(self._select_wallet_cmd, wallet_data.name),
                   style="Primary.TButton").pack(side="left", padx=(0, 5))
 
         ttk.Button(actions_frame, text="Remove",
-                  command=lambda: self.remove_wallet(wallet_data.name)).pack(side="left")
+                  command=(self._remove_wallet_cmd, wallet_data.name)).pack(side="left")
 
         return card
 
     def refresh_wallet_list(self):
         """Refresh the wallet list display"""
-        # Clear existing widgets
-        for widget in self.wallet_list_frame.winfo_children():
-            widget.destroy()
-        self.wallet_balance_labels.clear()
-
-        if not self.multi_wallet.wallets:
+        wallets = self.multi_wallet.wallets
+        if not wallets and self._wallet_empty_shown and not self._wallet_cards:
+            return  # Still empty; nothing to redraw or fetch
+
+        # Drop cards for removed wallets, or wallets re-added with different details
+        for name, (key, card) in list(self._wallet_cards.items()):
+            wallet_data = wallets.get(name)
+            if wallet_data is None or key != (wallet_data.address, wallet_data.network):
+                card.destroy()
+                del self._wallet_cards[name]
+        for name in list(self.wallet_balance_labels):
+            if name not in wallets:
+                del self.wallet_balance_labels[name]
+
+        if not wallets:
             # Show empty state
-            empty_frame = ttk.Frame(self.wallet_list_frame, style="Main.TFrame")
-            empty_frame.pack(fill="both", expand=True)
-
-            ttk.Label(empty_frame, text="No wallets added yet",
-                     style="Muted.TLabel").pack(anchor="center", pady=50)
-            ttk.Label(empty_frame, text="Add a wallet to get started",
-                     style="Muted.TLabel").pack(anchor="center")
+            if self._wallet_empty_frame is None:
+                empty_frame = ttk.Frame(self.wallet_list_frame, style="Main.TFrame")
+
+                ttk.Label(empty_frame, text="No wallets added yet",
+                         style="Muted.TLabel").pack(anchor="center", pady=50)
+                ttk.Label(empty_frame, text="Add a wallet to get started",
+                         style="Muted.TLabel").pack(anchor="center")
+                self._wallet_empty_frame = empty_frame
+            if not self._wallet_empty_shown:
+                self._wallet_empty_frame.pack(fill="both", expand=True)
+                self._wallet_empty_shown = True
         else:
-            # Show wallet cards
-            for name, wallet_data in self.multi_wallet.wallets.items():
+            if self._wallet_empty_shown:
+                self._wallet_empty_frame.pack_forget()
+                self._wallet_empty_shown = False
+
+            # Only build cards for wallets that don't have one yet
+            for name, wallet_data in wallets.items():
+                if name in self._wallet_cards:
+                    continue
                 card = self.create_wallet_card(self.wallet_list_frame, wallet_data)
                 card.pack(fill="x", pady=(0, 10))
+                self._wallet_cards[name] = ((wallet_data.address, wallet_data.network), card)
 
-        self.update_wallet_balances()
+        self._request_balance_refresh()
 
     def add_wallet_dialog(self):
         """Show dialog to add a new wallet"""
         dialog = WalletDialog(self.root, "Add New Wallet")
+        self.root.wait_window(dialog.dialog)
         if dialog.result:
             name, secret_input, network = dialog.result
 
@@ -870,9 +1369,8 @@ class ModernXRPWalletGUI:
                     messagebox.showinfo(
                         "Success", f"Wallet '{name}' added successfully!"
                     )
-                    self.refresh_wallet_list()
+                    self._request_list_refresh()
                     self.update_status(f"Added wallet: {name}")
-                    self.update_wallet_balances()
                 else:
                     messagebox.showerror(
                         "Error", "Failed to add wallet. Please check the secret."
@@ -882,14 +1380,14 @@ class ModernXRPWalletGUI:
 
     def import_private_key_dialog(self):
         """Show dialog to import a private key or seed"""
-        # Get private key or seed
-        secret_input = simpledialog.askstring(
-            "Import Private Key or Seed",
-            "Enter your private key (64 hex) or seed (s...):",
-            show="*",
+        # Secret, name and network are collected in one dialog
+        dialog = WalletDialog(
+            self.root, "Import Private Key or Seed", submit_text="Import Wallet"
         )
-        if not secret_input:
+        self.root.wait_window(dialog.dialog)
+        if not dialog.result:
             return
+        name, secret_input, network = dialog.result
 
         try:
             _, secret_info = create_wallet_from_secret(secret_input)
@@ -897,25 +1395,13 @@ class ModernXRPWalletGUI:
             messagebox.showerror("Invalid Secret", str(exc))
             return
 
-        # Get wallet name
-        name = simpledialog.askstring("Wallet Name", "Enter a name for this wallet:")
-        if not name:
-            return
-
-        # Get network
-        network = messagebox.askyesno(
-            "Network Selection", "Use mainnet? (No = testnet)"
-        )
-        network = "mainnet" if network else "testnet"
-
         try:
             if self.multi_wallet.add_wallet(
                 name, secret_info.secret, network, secret_info=secret_info
             ):
                 messagebox.showinfo("Success", f"Wallet imported as '{name}'!")
-                self.refresh_wallet_list()
+                self._request_list_refresh()
                 self.update_status(f"Imported wallet: {name}")
-                self.update_wallet_balances()
             else:
                 messagebox.showerror(
                     "Error", "Failed to import wallet. Please check the secret format."
@@ -958,7 +1444,7 @@ class ModernXRPWalletGUI:
                                 "This secret is also stored encrypted in data/wallets.enc."
                             ),
                         )
-                        self.refresh_wallet_list()
+                        self._request_list_refresh()
                         self.update_status("Test wallet generated successfully")
                     else:
                         messagebox.showerror(
@@ -977,7 +1463,7 @@ class ModernXRPWalletGUI:
 
                 self.run_on_ui_thread(show_error)
 
-        threading.Thread(target=generate_thread, daemon=True).start()
+        self._io_pool.submit(generate_thread)
 
     def select_wallet(self, name: str):
         """Select and open a wallet"""
@@ -992,20 +1478,34 @@ class ModernXRPWalletGUI:
         if messagebox.askyesno("Confirm Removal",
                              f"Are you sure you want to remove wallet '{name}'?\n\n"
                              "This will only remove it from the app, not delete the actual wallet."):
-            if self.multi_wallet.remove_wallet(name):
-                self.refresh_wallet_list()
+            try:
+                removed = self.multi_wallet.remove_wallet(name)
+            except Exception as exc:
+                messagebox.showerror("Remove Wallet Error", f"Failed to remove wallet:\n{exc}")
+                return
+            if removed:
+                self._request_list_refresh()
                 self.update_status(f"Removed wallet: {name}")
-                self.update_wallet_balances()
 
     def open_wallet_interface(self):
         """Open the main wallet interface"""
         # Clear and create the main wallet interface
+        self._release_interface_state()
         for widget in self.main_container.winfo_children():
             widget.destroy()
 
         # Create the main wallet interface (similar to original but with multi-wallet support)
         self.create_main_wallet_interface()
 
+    def _release_interface_state(self):
+        """Drop references to the wallet interface's widgets and Tk variables.
+
+        Lets the destroyed widgets and their variables be freed, and makes the
+        ``is not None`` guards in late worker callbacks see that the tabs are gone.
+        """
+        self.__dict__.update(dict.fromkeys(INTERFACE_ATTRS))
+        self._tree_rows.clear()
+
     def create_main_wallet_interface(self):
         """Create the main wallet management interface"""
         # Header with wallet selector
@@ -1032,16 +1532,31 @@ class ModernXRPWalletGUI:
         self.create_wallet_tab()
         self.create_send_tab()
         self.create_receive_tab()
-        self.create_history_tab()
-        self.create_multisig_tab()
+
+        # History and Multi-Sig are populated the first time they are selected
+        self.history_frame = ttk.Frame(self.notebook, style="Main.TFrame")
+        self.notebook.add(self.history_frame, text=TAB_HISTORY)
+        self.multisig_frame = ttk.Frame(self.notebook, style="Main.TFrame")
+        self.notebook.add(self.multisig_frame, text=TAB_MULTISIG)
+        self._deferred_tabs = {
+            str(self.history_frame): self.create_history_tab,
+            str(self.multisig_frame): self.create_multisig_tab,
+        }
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
 
         # Refresh wallet info
         self.refresh_wallet_info()
 
+    def _on_tab_changed(self, event=None):
+        """Build a deferred tab the first time it is shown."""
+        builder = self._deferred_tabs.pop(self.notebook.select(), None)
+        if builder is not None:
+            builder()
+
     def create_wallet_tab(self):
         """Create wallet overview tab"""
         self.wallet_frame = ttk.Frame(self.notebook, style="Main.TFrame")
-        self.notebook.add(self.wallet_frame, text="  💼 Wallet  ")
+        self.notebook.add(self.wallet_frame, text=TAB_WALLET)
 
         # Wallet info card
         info_card = self.create_card_frame(self.wallet_frame)
@@ -1068,6 +1583,7 @@ class ModernXRPWalletGUI:
         balance_label.grid(row=1, column=1, sticky="w", padx=(10, 0), pady=5)
 
         info_grid.columnconfigure(1, weight=1)
+        self._pin_label_column(info_grid, ("Address:", "Balance:"))
 
         # Action buttons
         actions_frame = ttk.Frame(info_card, style="Main.TFrame")
@@ -1103,7 +1619,7 @@ class ModernXRPWalletGUI:
     def create_send_tab(self):
         """Create send transaction tab"""
         self.send_frame = ttk.Frame(self.notebook, style="Main.TFrame")
-        self.notebook.add(self.send_frame, text="  💸 Send  ")
+        self.notebook.add(self.send_frame, text=TAB_SEND)
 
         # Send form card
         form_card = self.create_card_frame(self.send_frame)
@@ -1152,6 +1668,9 @@ class ModernXRPWalletGUI:
         memo_entry.grid(row=3, column=1, sticky="ew", padx=(10, 0), pady=10)
 
         form_grid.columnconfigure(1, weight=1)
+        self._pin_label_column(form_grid, (
+            "Destination Address:", "Amount (XRP):", "Destination Tag (optional):", "Memo (optional):",
+        ))
 
         # Send button
         ttk.Button(form_card, text="💸 Send Transaction",
@@ -1175,7 +1694,7 @@ class ModernXRPWalletGUI:
     def create_receive_tab(self):
         """Create receive tab with QR code"""
         self.receive_frame = ttk.Frame(self.notebook, style="Main.TFrame")
-        self.notebook.add(self.receive_frame, text="  📥 Receive  ")
+        self.notebook.add(self.receive_frame, text=TAB_RECEIVE)
 
         card = self.create_card_frame(self.receive_frame)
         card.pack(fill="both", expand=True)
@@ -1203,15 +1722,14 @@ class ModernXRPWalletGUI:
         ttk.Label(card, textvariable=self.receive_status_var, style="Muted.TLabel").pack(anchor="center")
 
     def create_history_tab(self):
-        """Create transaction history tab"""
-        self.history_frame = ttk.Frame(self.notebook, style="Main.TFrame")
-        self.notebook.add(self.history_frame, text="  📊 History  ")
-
+        """Populate the transaction history tab"""
         toolbar = ttk.Frame(self.history_frame, style="Main.TFrame")
         toolbar.pack(fill="x", pady=(0, 10))
 
         ttk.Button(toolbar, text="🔄 Refresh", command=self.refresh_history,
                   style="Primary.TButton").pack(side="left")
+        ttk.Button(toolbar, text="Load More",
+                  command=self.load_more_history).pack(side="left", padx=(10, 0))
 
         self.history_status_var = tk.StringVar(value="")
         ttk.Label(toolbar, textvariable=self.history_status_var,
@@ -1220,8 +1738,8 @@ class ModernXRPWalletGUI:
         filter_frame = ttk.Frame(self.history_frame, style="Main.TFrame")
         filter_frame.pack(fill="x", pady=(0, 10))
 
-        ttk.Label(filter_frame, text="Limit:", style="Muted.TLabel").pack(side="left")
-        self.limit_var = tk.StringVar(value="20")
+        ttk.Label(filter_frame, text="Page size:", style="Muted.TLabel").pack(side="left")
+        self.limit_var = tk.StringVar(value=str(HISTORY_PAGE_SIZE))
         ttk.Combobox(filter_frame, textvariable=self.limit_var,
                      values=["10", "20", "50", "100"], width=10).pack(side="left", padx=(5, 20))
 
@@ -1264,11 +1782,12 @@ class ModernXRPWalletGUI:
         self.history_list.column("date", width=150)
         self.history_list.column("status", width=100)
 
-        recent_scroll = ttk.Scrollbar(recent_card, orient="vertical",
-                                     command=self.history_list.yview)
-        self.history_list.configure(yscrollcommand=recent_scroll.set)
+        self.history_scroll = ttk.Scrollbar(recent_card, orient="vertical",
+                                            command=self.history_list.yview)
+        # Rows are added in chunks as the list is scrolled towards its end
+        self.history_list.configure(yscrollcommand=self._on_history_yscroll)
         self.history_list.pack(side="left", fill="both", expand=True)
-        recent_scroll.pack(side="left", fill="y")
+        self.history_scroll.pack(side="left", fill="y")
 
         # Details area
         detail_card = self.create_card_frame(body)
@@ -1290,13 +1809,17 @@ class ModernXRPWalletGUI:
         self.history_list.bind("<<TreeviewSelect>>", self.on_history_select)
 
         self.history_records: List[Dict] = []
+        # Hash -> record, for selection lookups
+        self.history_index: Dict[str, Dict] = {}
+        # Number of history_records currently inserted into the Treeview
+        self.history_rendered = 0
+        # account_tx marker for the next page, and the wallet the loaded pages belong to
+        self.history_marker = None
+        self.history_address: Optional[str] = None
         self.refresh_history()
 
     def create_multisig_tab(self):
-        """Create enhanced multi-signature workflow"""
-        self.multisig_frame = ttk.Frame(self.notebook, style="Main.TFrame")
-        self.notebook.add(self.multisig_frame, text="  🔐 Multi-Sig  ")
-
+        """Populate the enhanced multi-signature workflow tab"""
         # Status card
         status_card = self.create_card_frame(self.multisig_frame)
         status_card.pack(fill="x", pady=(0, 15))
@@ -1305,7 +1828,7 @@ class ModernXRPWalletGUI:
         header.pack(fill="x")
         ttk.Label(header, text="Current Multi-Signature Status",
                  style="Heading.TLabel").pack(side="left")
-        ttk.Button(header, text="🔄 Refresh", command=self.refresh_multisig_status,
+        ttk.Button(header, text="🔄 Refresh", command=self._request_multisig_refresh,
                   style="Primary.TButton").pack(side="right")
         ttk.Button(header, text="📋 Copy", command=self.copy_multisig_status).pack(side="right", padx=(0, 10))
 
@@ -1355,8 +1878,10 @@ class ModernXRPWalletGUI:
         self.multisig_cost_var = tk.StringVar(value="Cost: --")
         ttk.Label(setup_footer, textvariable=self.multisig_cost_var, style="Muted.TLabel").pack(side="left")
 
-        ttk.Button(setup_footer, text="Apply Signer List", style="Primary.TButton",
-                  command=self.apply_signer_list).pack(side="right")
+        self.multisig_apply_button = ttk.Button(setup_footer, text="Apply Signer List",
+                                                style="Primary.TButton",
+                                                command=self.apply_signer_list)
+        self.multisig_apply_button.pack(side="right")
 
         # Transaction builder
         tx_card = self.create_card_frame(self.multisig_frame)
@@ -1386,6 +1911,7 @@ class ModernXRPWalletGUI:
         ttk.Entry(form, textvariable=self.multisig_memo_var, width=40).grid(row=3, column=1, sticky="ew", padx=(10, 0))
 
         form.columnconfigure(1, weight=1)
+        self._pin_label_column(form, ("Destination:", "Amount (XRP):", "Destination Tag:", "Memo:"))
 
         builder_buttons = ttk.Frame(tx_card, style="Main.TFrame")
         builder_buttons.pack(fill="x", pady=(10, 0))
@@ -1427,15 +1953,17 @@ class ModernXRPWalletGUI:
         signing_buttons = ttk.Frame(signing_card, style="Main.TFrame")
         signing_buttons.pack(fill="x", pady=(10, 0))
 
-        ttk.Button(signing_buttons, text="✍️ Sign as Active Wallet",
-                  command=self.sign_as_active_wallet).pack(side="left")
+        self.multisig_sign_button = ttk.Button(signing_buttons, text="✍️ Sign as Active Wallet",
+                                               command=self.sign_as_active_wallet)
+        self.multisig_sign_button.pack(side="left")
         ttk.Button(signing_buttons, text="📁 Import Signed",
                   command=self.import_signed_package).pack(side="left", padx=(10, 0))
         ttk.Button(signing_buttons, text="📋 Copy Instructions",
                   command=self.copy_signing_request).pack(side="left", padx=(10, 0))
-        ttk.Button(signing_buttons, text="🚀 Submit",
-                  command=self.submit_multisig_transaction_action,
-                  style="Primary.TButton").pack(side="right")
+        self.multisig_submit_button = ttk.Button(signing_buttons, text="🚀 Submit",
+                                                 command=self.submit_multisig_transaction_action,
+                                                 style="Primary.TButton")
+        self.multisig_submit_button.pack(side="right")
 
         self.multisig_signing_status_var = tk.StringVar(value="Awaiting transaction preparation")
         ttk.Label(signing_card, textvariable=self.multisig_signing_status_var,
@@ -1447,37 +1975,35 @@ class ModernXRPWalletGUI:
         manager = self.multi_wallet.get_active_manager()
         if not manager or not manager.wallet:
             self.multisig_status_var.set("Select a wallet to view multisignature status")
-            self.multisig_status_tree.delete(*self.multisig_status_tree.get_children())
+            self._sync_tree(self.multisig_status_tree, [])
             return
 
         status = manager.get_signer_list()
         self.multisig_status = status
-        self.multisig_status_tree.delete(*self.multisig_status_tree.get_children())
 
         if not status.get('enabled'):
             self.multisig_status_var.set("This wallet is currently single-signature.")
-            self.multisig_signer_entries = []
+            self._sync_tree(self.multisig_status_tree, [])
+            self.multisig_signer_entries = {}
         else:
             quorum = status.get('quorum', 0)
             signers = status.get('signers', [])
             self.multisig_status_var.set(
                 f"Multisig enabled • Quorum {quorum} of {len(signers)} signers"
             )
-            for entry in signers:
-                self.multisig_status_tree.insert(
-                    "",
-                    "end",
-                    values=(entry.get('account', ''), entry.get('weight', 1)),
-                )
-            self.multisig_signer_entries = [
-                {
+            self._sync_tree(self.multisig_status_tree, [
+                (entry.get('account', ''), (entry.get('account', ''), entry.get('weight', 1)))
+                for entry in signers
+            ])
+            self.multisig_signer_entries = {
+                self._new_signer_iid(): {
                     'label': entry.get('account', '')[:12] + '...',
                     'address': entry.get('account', ''),
                     'tag': '',
                     'weight': entry.get('weight', 1),
                 }
                 for entry in signers
-            ]
+            }
 
         self.update_multisig_cost_summary()
         self.update_multisig_signer_table()
@@ -1503,7 +2029,7 @@ class ModernXRPWalletGUI:
         dialog = SignerEntryDialog(self.root, self.multi_wallet)
         self.root.wait_window(dialog.dialog)
         if dialog.result:
-            self.multisig_signer_entries.append(dialog.result)
+            self.multisig_signer_entries[self._new_signer_iid()] = dialog.result
             self.update_multisig_signer_table()
             self.update_multisig_cost_summary()
 
@@ -1512,25 +2038,23 @@ class ModernXRPWalletGUI:
         if not selection:
             messagebox.showinfo("Edit Signer", "Select a signer to edit")
             return
-        index = self.multisig_signer_tree.index(selection[0])
-        if not (0 <= index < len(self.multisig_signer_entries)):
+        iid = selection[0]
+        if iid not in self.multisig_signer_entries:
             return
         dialog = SignerEntryDialog(self.root, self.multi_wallet, title="Edit Signer",
-                                   initial=self.multisig_signer_entries[index])
+                                   initial=self.multisig_signer_entries[iid])
         self.root.wait_window(dialog.dialog)
         if dialog.result:
-            self.multisig_signer_entries[index] = dialog.result
+            # Same key, so the edit keeps its position and updates the row in place
+            self.multisig_signer_entries[iid] = dialog.result
             self.update_multisig_signer_table()
-            self.update_multisig_cost_summary()
 
     def remove_signer_entry(self):
         selection = self.multisig_signer_tree.selection()
         if not selection:
             messagebox.showinfo("Remove Signer", "Select a signer to remove")
             return
-        index = self.multisig_signer_tree.index(selection[0])
-        if 0 <= index < len(self.multisig_signer_entries):
-            del self.multisig_signer_entries[index]
+        if self.multisig_signer_entries.pop(selection[0], None) is not None:
             self.update_multisig_signer_table()
             self.update_multisig_cost_summary()
 
@@ -1542,19 +2066,49 @@ class ModernXRPWalletGUI:
             self.update_multisig_signer_table()
             self.update_multisig_cost_summary()
 
+    def _new_signer_iid(self) -> str:
+        return f"signer{next(self._signer_ids)}"
+
     def update_multisig_signer_table(self):
-        self.multisig_signer_tree.delete(*self.multisig_signer_tree.get_children())
-        for entry in self.multisig_signer_entries:
-            self.multisig_signer_tree.insert(
-                "",
-                "end",
-                values=(
+        self._sync_tree(self.multisig_signer_tree, [
+            (
+                iid,
+                (
                     entry.get('label', ''),
                     entry.get('address', ''),
                     entry.get('tag', ''),
                     entry.get('weight', 1),
                 ),
             )
+            for iid, entry in self.multisig_signer_entries.items()
+        ])
+
+    def _sync_tree(self, tree: ttk.Treeview, rows) -> None:
+        """Show rows ((iid, values), ...) in order, touching only rows that changed."""
+        shown = self._tree_rows.setdefault(str(tree), {})
+        wanted = dict(rows)
+        insert = tree.insert
+        if not shown:
+            # Empty tree: append every row in one tight loop, nothing to diff or reorder
+            for iid, values in wanted.items():
+                insert("", "end", iid=iid, values=values)
+            shown.update(wanted)
+            return
+        stale = [iid for iid in shown if iid not in wanted]
+        if stale:
+            tree.delete(*stale)
+            for iid in stale:
+                del shown[iid]
+        item = tree.item
+        for position, (iid, values) in enumerate(wanted.items()):
+            if iid not in shown:
+                insert("", position, iid=iid, values=values)
+            elif shown[iid] != values:
+                item(iid, values=values)
+            shown[iid] = values
+        if tree.get_children() != tuple(wanted):
+            for position, iid in enumerate(wanted):
+                tree.move(iid, "", position)
 
     def update_multisig_cost_summary(self):
         signer_count = len(self.multisig_signer_entries)
@@ -1563,13 +2117,48 @@ class ModernXRPWalletGUI:
             if not manager:
                 self.multisig_cost_var.set("Cost: --")
                 return
-            cost = manager.estimate_signer_list_cost(signer_count)
+            # Reserves come from server_info once per network; the cost is then local arithmetic
+            network_info = self._reserve_info.get(manager.network)
+            if network_info is None:
+                self.multisig_cost_var.set("Cost: loading...")
+                self._fetch_reserve_info(manager)
+                return
+            cost = manager.estimate_signer_list_cost(signer_count, network_info)
             self.multisig_cost_var.set(
                 f"Reserve base {cost['reserve_base']:.6f} XRP + signers {cost['additional_reserve']:.6f} XRP"
             )
         except Exception as exc:
             self.multisig_cost_var.set(f"Cost: unavailable ({exc})")
 
+    def _remember_reserves(self, network: Optional[str], info: Dict):
+        """Reuse server_info fetched elsewhere for multisig cost previews."""
+        if not network or "error" in info:
+            return
+        self._reserve_info[network] = info
+        if self.multisig_cost_var is not None:
+            self.update_multisig_cost_summary()
+
+    def _fetch_reserve_info(self, manager: XRPWalletManager):
+        network = manager.network
+        if network in self._reserve_pending:
+            return
+        self._reserve_pending.add(network)
+
+        def worker():
+            info = manager.get_network_info()
+
+            def apply():
+                self._reserve_pending.discard(network)
+                if 'error' in info:
+                    if self.multisig_cost_var is not None:
+                        self.multisig_cost_var.set(f"Cost: unavailable ({info['error']})")
+                    return
+                self._remember_reserves(network, info)
+
+            self.run_on_ui_thread(apply)
+
+        self._io_pool.submit(worker)
+
     def apply_signer_list(self):
         manager = self.multi_wallet.get_active_manager()
         if not manager or not manager.wallet:
@@ -1588,19 +2177,31 @@ class ModernXRPWalletGUI:
             return
 
         payload = [
-            {'account': entry['address'], 'weight': entry.get('weight', 1)}
-            for entry in self.multisig_signer_entries
+            {'account': account, 'weight': weight}
+            for account, weight in map(_signer_account_weight, self.multisig_signer_entries.values())
         ]
-        result = manager.create_multisig_wallet(payload, quorum)
-        if result.get('success'):
-            messagebox.showinfo(
-                "Multisig",
-                "Signer list transaction submitted. It becomes active after ledger validation.",
-            )
-            self.update_status("Signer list submitted")
-            self.refresh_multisig_status()
-        else:
-            messagebox.showerror("Multisig", f"Failed to submit signer list:\n{result.get('error')}")
+        self._set_button_busy("multisig_apply_button", True)
+        self.update_status("Submitting signer list...")
+
+        def worker():
+            result = manager.create_multisig_wallet(payload, quorum)
+
+            def apply():
+                self._set_button_busy("multisig_apply_button", False)
+                if result.get('success'):
+                    messagebox.showinfo(
+                        "Multisig",
+                        "Signer list transaction submitted. It becomes active after ledger validation.",
+                    )
+                    self.update_status("Signer list submitted")
+                    self._request_multisig_refresh()
+                else:
+                    self.update_status("Signer list submission failed")
+                    messagebox.showerror("Multisig", f"Failed to submit signer list:\n{result.get('error')}")
+
+            self.run_on_ui_thread(apply)
+
+        self._io_pool.submit(worker)
 
     def choose_destination_from_book(self):
         dialog = AddressBookDialog(self.root, self.multi_wallet)
@@ -1624,12 +2225,12 @@ class ModernXRPWalletGUI:
         tag_value = self.multisig_dest_tag_var.get().strip()
         destination_tag = None
         if tag_value:
-            if not tag_value.isdigit():
-                messagebox.showerror("Multisig", "Destination tag must be a number")
+            destination_tag = _parse_destination_tag(tag_value)
+            if destination_tag is None:
+                messagebox.showerror("Multisig", "Destination tag must be a number between 0 and 2^32-1")
                 return
-            destination_tag = int(tag_value)
 
-        if not destination or not destination.startswith('r'):
+        if not destination or not is_valid_classic_address(destination):
             messagebox.showerror("Multisig", "Enter a valid destination address")
             return
         if not amount:
@@ -1642,17 +2243,17 @@ class ModernXRPWalletGUI:
             messagebox.showerror("Multisig", f"Failed to prepare transaction:\n{exc}")
             return
 
+        # Serialized once here; signing, copying and saving reuse these strings
         self.multisig_session = {
             'tx_json': tx_json,
+            'tx_json_serialized': json.dumps(tx_json),
+            'tx_json_pretty': json.dumps(tx_json, indent=2),
             'signatures': {},
             'required_signers': self.multisig_status.get('signers', []),
             'quorum': self.multisig_status.get('quorum', 1),
         }
 
-        self.multisig_tx_preview.config(state="normal")
-        self.multisig_tx_preview.delete("1.0", tk.END)
-        self.multisig_tx_preview.insert("1.0", json.dumps(tx_json, indent=2))
-        self.multisig_tx_preview.config(state="disabled")
+        self.update_text_widget(self.multisig_tx_preview, self.multisig_session['tx_json_pretty'])
         self.multisig_tx_status_var.set(
             f"Transaction prepared. Need {self.multisig_session['quorum']} signatures."
         )
@@ -1671,7 +2272,7 @@ class ModernXRPWalletGUI:
             f"Amount (drops): {tx_json.get('Amount')}\n"
             f"Destination: {tx_json.get('Destination')}\n"
             "\nJSON payload:\n"
-            f"{json.dumps(tx_json, indent=2)}"
+            f"{self.multisig_session['tx_json_pretty']}"
         )
         self.root.clipboard_clear()
         self.root.clipboard_append(instructions)
@@ -1689,7 +2290,7 @@ class ModernXRPWalletGUI:
         if not filename:
             return
         with open(filename, "w") as f:
-            json.dump(self.multisig_session['tx_json'], f, indent=2)
+            f.write(self.multisig_session['tx_json_pretty'])
         self.update_status(f"Signing request saved to {filename}")
 
     def sign_as_active_wallet(self):
@@ -1700,15 +2301,26 @@ class ModernXRPWalletGUI:
         if not self.multisig_session:
             messagebox.showinfo("Multisig", "Prepare a transaction first")
             return
-        tx_json = json.dumps(self.multisig_session['tx_json'])
-        result = manager.sign_multisig_transaction(tx_json, manager.wallet)
-        if not result.get('success'):
-            messagebox.showerror("Multisig", f"Failed to sign:\n{result.get('error')}")
-            return
-        address = result.get('signer')
-        self.multisig_session['signatures'][address] = result
-        self.update_status("Signature added")
-        self.update_multisig_signing_table()
+        session = self.multisig_session
+        self._set_button_busy("multisig_sign_button", True)
+
+        def worker():
+            result = manager.sign_multisig_transaction(session['tx_json_serialized'], manager.wallet)
+
+            def apply():
+                self._set_button_busy("multisig_sign_button", False)
+                if not result.get('success'):
+                    messagebox.showerror("Multisig", f"Failed to sign:\n{result.get('error')}")
+                    return
+                # The signature belongs to the transaction it was made for, even if replaced since
+                session['signatures'][result.get('signer')] = result
+                if self.multisig_session is session and self.multisig_signing_tree is not None:
+                    self.update_status("Signature added")
+                    self.update_multisig_signing_table()
+
+            self.run_on_ui_thread(apply)
+
+        self._io_pool.submit(worker)
 
     def import_signed_package(self):
         if not self.multisig_session:
@@ -1733,23 +2345,33 @@ class ModernXRPWalletGUI:
             messagebox.showerror("Multisig", f"Failed to import signature:\n{exc}")
 
     def update_multisig_signing_table(self):
-        self.multisig_signing_tree.delete(*self.multisig_signing_tree.get_children())
         session = self.multisig_session
         if not session:
+            self._sync_tree(self.multisig_signing_tree, [])
             return
         signatures = session.get('signatures', {})
         signers = session.get('required_signers', [])
+
+        # Rows keyed by account; required accounts go in a set for O(1) membership
+        rows = []
+        required_accounts = set()
         collected = 0
         for entry in signers:
             addr = entry.get('account')
             weight = entry.get('weight', 1)
-            status = "Signed" if addr in signatures else "Pending"
-            if status == "Signed":
+            required_accounts.add(addr)
+            if addr in signatures:
                 collected += weight
-            self.multisig_signing_tree.insert("", "end", values=(addr, weight, status))
-        additional = [addr for addr in signatures.keys() if addr not in [s.get('account') for s in signers]]
-        for addr in additional:
-            self.multisig_signing_tree.insert("", "end", values=(addr, "--", "Additional"))
+                rows.append((str(addr), (addr, weight, "Signed")))
+            else:
+                rows.append((str(addr), (addr, weight, "Pending")))
+        rows.extend(
+            (str(addr), (addr, "--", "Additional"))
+            for addr in signatures
+            if addr not in required_accounts
+        )
+
+        self._sync_tree(self.multisig_signing_tree, rows)
         quorum = session.get('quorum', 1)
         self.multisig_signing_status_var.set(f"Collected weight {collected} / {quorum}")
 
@@ -1766,18 +2388,37 @@ class ModernXRPWalletGUI:
         if len(signatures) < quorum:
             messagebox.showinfo("Multisig", "Not enough signatures collected yet")
             return
-        result = manager.submit_multisig_transaction(signatures)
-        if result.get('success'):
-            messagebox.showinfo("Multisig", f"Transaction submitted. Hash: {result['hash']}")
-            self.update_status("Submitted multi-signed transaction")
-            self.multisig_session = None
-            self.multisig_signing_tree.delete(*self.multisig_signing_tree.get_children())
-            self.multisig_signing_status_var.set("Transaction submitted")
-            self.multisig_tx_preview.config(state="normal")
-            self.multisig_tx_preview.delete("1.0", tk.END)
-            self.multisig_tx_preview.config(state="disabled")
-        else:
-            messagebox.showerror("Multisig", f"Failed to submit:\n{result.get('error')}")
+        session = self.multisig_session
+        self._set_button_busy("multisig_submit_button", True)
+        self.update_status("Submitting multi-signed transaction...")
+
+        def worker():
+            result = manager.submit_multisig_transaction(signatures)
+
+            def apply():
+                self._set_button_busy("multisig_submit_button", False)
+                if not result.get('success'):
+                    self.update_status("Multi-signed submission failed")
+                    messagebox.showerror("Multisig", f"Failed to submit:\n{result.get('error')}")
+                    return
+                self.update_status("Submitted multi-signed transaction")
+                if self.multisig_session is session:
+                    self.multisig_session = None
+                    if self.multisig_signing_tree is not None:
+                        self._sync_tree(self.multisig_signing_tree, [])
+                        self.multisig_signing_status_var.set("Transaction submitted")
+                        self.update_text_widget(self.multisig_tx_preview, "")
+                messagebox.showinfo("Multisig", f"Transaction submitted. Hash: {result['hash']}")
+
+            self.run_on_ui_thread(apply)
+
+        self._io_pool.submit(worker)
+
+    def _set_button_busy(self, attr: str, busy: bool):
+        """Disable an interface button while its background request runs."""
+        button = getattr(self, attr)
+        if button is not None and button.winfo_exists():
+            button.configure(state="disabled" if busy else "normal")
 
     def setup_status_bar(self):
         """Setup the status bar"""
@@ -1789,6 +2430,19 @@ class ModernXRPWalletGUI:
                                     style="Muted.TLabel")
         self.status_label.pack(side="left")
 
+    def _report_save_error(self):
+        # A synchronous caller may already have taken (and reported) the failure
+        error = self.multi_wallet.take_save_error()
+        if error is None:
+            return
+        self.update_status("Failed to save wallet changes")
+        messagebox.showerror(
+            "Save Failed",
+            f"Wallet changes could not be written to disk:\n{error}\n\n"
+            "They are kept in memory and will be retried on the next change.",
+            parent=self.root,
+        )
+
     def update_status(self, message: str):
         """Update status bar"""
         timestamp = datetime.now().strftime('%H:%M:%S')
@@ -1796,11 +2450,16 @@ class ModernXRPWalletGUI:
 
     def update_network_status(self):
         """Update network status display"""
+        if self._network_status_pending:
+            return
+        self._network_status_pending = True
+
         def update_thread():
             try:
-                # Create a temporary manager to get network info
-                temp_manager = XRPWalletManager()
-                network_info = temp_manager.get_network_info()
+                # Only one probe runs at a time, so the shared manager needs no lock
+                if self._network_probe is None:
+                    self._network_probe = XRPWalletManager()
+                network_info = self._network_probe.get_network_info()
 
                 if "error" not in network_info:
                     info_lines = [
@@ -1817,13 +2476,17 @@ class ModernXRPWalletGUI:
                     info_text = f"❌ Network Error: {network_info['error']}"
 
             except Exception as exc:
+                network_info = {"error": str(exc)}
                 info_text = f"❌ Connection Error: {exc}"
 
-            self.run_on_ui_thread(
-                lambda: self.update_text_widget(self.network_status_text, info_text)
-            )
+            def apply():
+                self._network_status_pending = False
+                self._remember_reserves(network_info.get("network"), network_info)
+                self.update_text_widget(self.network_status_text, info_text)
+
+            self.run_on_ui_thread(apply)
 
-        threading.Thread(target=update_thread, daemon=True).start()
+        self._io_pool.submit(update_thread)
 
     # Wallet management methods (similar to original but adapted for multi-wallet)
     def refresh_wallet_info(self):
@@ -1836,7 +2499,7 @@ class ModernXRPWalletGUI:
                 self.balance_var.set(
                     f"{active_record.balance} XRP" if active_record.balance else "N/A"
                 )
-                if hasattr(self, "send_balance_var"):
+                if self.send_balance_var is not None:
                     self.send_balance_var.set(
                         f"Available: {active_record.balance} XRP"
                         if active_record.balance not in (None, "", "Error")
@@ -1846,7 +2509,7 @@ class ModernXRPWalletGUI:
             else:
                 self.address_var.set("No wallet selected")
                 self.balance_var.set("N/A")
-                if hasattr(self, "send_balance_var"):
+                if self.send_balance_var is not None:
                     self.send_balance_var.set("Available: N/A")
                 self.update_receive_tab(None)
             return
@@ -1881,19 +2544,23 @@ class ModernXRPWalletGUI:
             except Exception as exc:
                 address = None
                 balance_value = None
+                network_info = {"error": str(exc)}
                 info_text = f"❌ Error refreshing wallet: {exc}"
                 status_message = f"Error refreshing wallet: {exc}"
 
             def apply_updates():
+                self._remember_reserves(manager.network, network_info)
+                if self.address_var is None:
+                    return  # Wallet interface closed while refreshing
                 address_value = address or self.address_var.get()
                 self.address_var.set(address_value)
                 if balance_value is not None:
                     self.balance_var.set(f"{balance_value} XRP")
-                    if hasattr(self, "send_balance_var"):
+                    if self.send_balance_var is not None:
                         self.send_balance_var.set(f"Available: {balance_value} XRP")
                 elif info_text.startswith("❌"):
                     self.balance_var.set("Error")
-                    if hasattr(self, "send_balance_var"):
+                    if self.send_balance_var is not None:
                         self.send_balance_var.set("Available: Error")
                 if info_text:
                     self.update_text_widget(self.network_text, info_text)
@@ -1902,54 +2569,103 @@ class ModernXRPWalletGUI:
 
             self.run_on_ui_thread(apply_updates)
 
-        threading.Thread(target=refresh_thread, daemon=True).start()
+        self._io_pool.submit(refresh_thread)
 
     def update_wallet_balances(self):
         """Refresh balance information for all wallets shown on the overview."""
 
-        def balance_thread():
-            if not self.multi_wallet.wallets:
-                return
+        wallets = list(self.multi_wallet.wallets.items())
+        for name in list(self._balance_cache):
+            if name not in self.multi_wallet.wallets:
+                del self._balance_cache[name]
+
+        # Reuse recent balances; only stale wallets go back to the ledger
+        now = time.monotonic()
+        stale = []
+        for name, wallet_data in wallets:
+            cached = self._balance_cache.get(name)
+            if cached and now - cached[0] < BALANCE_CACHE_TTL:
+                label = self.wallet_balance_labels.get(name)
+                if label is not None and label.winfo_exists():
+                    label.configure(text=cached[1])
+            else:
+                stale.append((name, wallet_data))
+        if not stale:
+            return
 
-            for name, wallet_data in self.multi_wallet.wallets.items():
-                try:
-                    manager = self.multi_wallet.get_or_create_manager(name)
-                    if not manager or not manager.wallet:
-                        raise RuntimeError("Wallet not available")
-
-                    balance_value = manager.get_balance()
-                    wallet_data.address = manager.wallet.address
-                    if balance_value.startswith("Error"):
-                        wallet_data.balance = "Error"
-                        display_text = balance_value
-                    else:
-                        wallet_data.balance = balance_value
-                        display_text = f"{balance_value} XRP"
+        # Results queue up here; one UI callback drains whatever has arrived
+        pending: List[tuple] = []
+        remaining = [len(stale)]
+        pending_lock = threading.Lock()
 
-                except Exception as exc:
-                    wallet_data.balance = "Error"
-                    display_text = f"Error: {exc}"
+        def flush():
+            with pending_lock:
+                batch = pending[:]
+                pending.clear()
+                finished = remaining[0] == 0
+            self._apply_balance_updates(batch)
+            if finished:
+                self.update_status("Wallet balances refreshed")
 
-                def apply(name=name, text=display_text, balance=wallet_data.balance, address=wallet_data.address):
-                    var = self.wallet_balance_labels.get(name)
-                    if var:
-                        var.set(text)
-                    active = self.multi_wallet.get_active_wallet()
-                    if active and active.name == name and hasattr(self, "send_balance_var"):
-                        if balance not in (None, "", "Error") and not str(balance).startswith("Error"):
-                            self.send_balance_var.set(f"Available: {balance} XRP")
-                        else:
-                            self.send_balance_var.set("Available: Error")
-                        self.update_receive_tab(address)
+        def fetch_balance(name: str, wallet_data: WalletData, manager, error):
+            try:
+                if error is not None:
+                    raise error
+                if not manager or not manager.wallet:
+                    raise RuntimeError("Wallet not available")
 
-                self.run_on_ui_thread(apply)
+                balance_value = manager.get_balance()
+                wallet_data.address = manager.wallet.address
+                if balance_value.startswith("Error"):
+                    wallet_data.balance = "Error"
+                    display_text = balance_value
+                else:
+                    wallet_data.balance = balance_value
+                    display_text = f"{balance_value} XRP"
+                    self._balance_cache[name] = (time.monotonic(), display_text)
 
-            self.run_on_ui_thread(lambda: self.update_status("Wallet balances refreshed"))
+            except Exception as exc:
+                wallet_data.balance = "Error"
+                display_text = f"Error: {exc}"
+
+            with pending_lock:
+                pending.append((name, display_text, wallet_data.balance, wallet_data.address))
+                remaining[0] -= 1
+                schedule = len(pending) == 1
+            if schedule:
+                self.run_on_ui_thread(flush)
+
+        # One task per wallet so balances arrive as each request completes.
+        # Managers are resolved here so workers never touch the wallet caches.
+        for name, wallet_data in stale:
+            manager, error = None, None
+            try:
+                manager = self.multi_wallet.get_or_create_manager(name)
+            except Exception as exc:
+                error = exc
+            self._balance_pool.submit(fetch_balance, name, wallet_data, manager, error)
 
-        threading.Thread(target=balance_thread, daemon=True).start()
+    def _apply_balance_updates(self, updates: List[tuple]):
+        """Show a batch of (name, text, balance, address) results from update_wallet_balances."""
+        active = self.multi_wallet.get_active_wallet()
+        active_update = None
+        for name, text, balance, address in updates:
+            label = self.wallet_balance_labels.get(name)
+            if label is not None and label.winfo_exists():
+                label.configure(text=text)
+            if active and active.name == name:
+                active_update = (balance, address)
+
+        if active_update is not None and self.send_balance_var is not None:
+            balance, address = active_update
+            if balance not in (None, "", "Error") and not str(balance).startswith("Error"):
+                self.send_balance_var.set(f"Available: {balance} XRP")
+            else:
+                self.send_balance_var.set("Available: Error")
+            self.update_receive_tab(address)
 
     def update_receive_tab(self, address: Optional[str]):
-        if not hasattr(self, "receive_address_var"):
+        if self.receive_address_var is None:
             return
 
         if not address or not address.startswith("r"):
@@ -1961,58 +2677,81 @@ class ModernXRPWalletGUI:
             return
 
         self.receive_address_var.set(address)
-        if address == self.receive_last_address and address in self.receive_qr_cache:
-            self.receive_qr_image = self.receive_qr_cache[address]
-            self.receive_qr_label.configure(image=self.receive_qr_image)
+        self.receive_last_address = address
+        key = (address, QR_SIZE_PX)
+        cached = self.receive_qr_cache.get(key)
+        if cached is not None:
+            self.receive_qr_cache.move_to_end(key)
+            self.receive_qr_image = cached
+            self.receive_qr_label.configure(image=cached)
             self.receive_status_var.set("")
             return
 
-        self.receive_last_address = address
         self.receive_status_var.set("Fetching QR code...")
         self.receive_qr_label.configure(image="", text="")
+        if key in self._qr_pending:
+            return
+        self._qr_pending.add(key)
 
         def worker():
-            image = self._fetch_qr_image(address)
+            png = None
+            try:
+                png = self._fetch_qr_image(address, QR_SIZE_PX)
+                error = None
+            except Exception as exc:
+                # Formatted here: exc is unbound once this except block ends
+                error = f"QR error: {exc}"
 
             def apply():
-                if image:
-                    self.receive_qr_cache[address] = image
+                self._qr_pending.discard(key)
+                current = (
+                    self.receive_qr_label is not None
+                    and self.receive_last_address == address
+                )
+                if png is None:
+                    if current:
+                        self.receive_status_var.set(error)
+                    return
+
+                # PhotoImage must be created on the Tk thread; Tk 8.6 reads PNG bytes directly
+                image = tk.PhotoImage(data=png)
+                self.receive_qr_cache[key] = image
+                while len(self.receive_qr_cache) > QR_CACHE_SIZE:
+                    self.receive_qr_cache.popitem(last=False)
+                if current:
                     self.receive_qr_image = image
                     self.receive_qr_label.configure(image=image)
                     self.receive_status_var.set("")
-                else:
-                    self.receive_status_var.set("QR unavailable")
 
             self.run_on_ui_thread(apply)
 
-        threading.Thread(target=worker, daemon=True).start()
-
-    def _fetch_qr_image(self, data: str) -> Optional[tk.PhotoImage]:
-        try:
-            response = requests.get(
-                "https://api.qrserver.com/v1/create-qr-code/",
-                params={"size": "240x240", "data": data},
-                timeout=10,
-            )
-            response.raise_for_status()
-            encoded = base64.b64encode(response.content).decode("ascii")
-            return tk.PhotoImage(data=encoded)
-        except Exception as exc:
-            self.run_on_ui_thread(lambda: self.receive_status_var.set(f"QR error: {exc}"))
-            return None
+        self._io_pool.submit(worker)
+
+    def _fetch_qr_image(self, data: str, size: int) -> bytes:
+        """Render (or, without segno, download) a QR code as PNG bytes for tk.PhotoImage.
+
+        Errors propagate to the caller, which reports them on the Tk thread.
+        """
+        if segno is not None:
+            qr = segno.make(data, error="m")
+            width, _ = qr.symbol_size(border=4)
+            buf = io.BytesIO()
+            qr.save(buf, kind="png", scale=max(1, size // width), border=4)
+            return buf.getvalue()
+        response = self._qr_session.get(
+            "https://api.qrserver.com/v1/create-qr-code/",
+            params={"size": f"{size}x{size}", "data": data},
+            timeout=10,
+        )
+        response.raise_for_status()
+        return response.content
 
     @staticmethod
     def _build_explorer_url(address: str, network: str) -> Optional[str]:
         if not address:
             return None
-        net = (network or "mainnet").lower()
-        if net == "mainnet":
-            return f"https://livenet.xrpl.org/accounts/{address}"
-        if net == "testnet":
-            return f"https://testnet.xrpl.org/accounts/{address}"
-        if net == "devnet":
-            return f"https://devnet.xrpl.org/accounts/{address}"
-        return f"https://xrpscan.com/account/{address}"
+        template = EXPLORER_ACCOUNT_URLS.get((network or "mainnet").lower(), DEFAULT_EXPLORER_ACCOUNT_URL)
+        return template.format(address)
 
     def copy_address(self):
         """Copy wallet address to clipboard"""
@@ -2026,7 +2765,7 @@ class ModernXRPWalletGUI:
 
     def copy_receive_address(self):
         """Copy receive tab address"""
-        address = self.receive_address_var.get() if hasattr(self, "receive_address_var") else None
+        address = self.receive_address_var.get() if self.receive_address_var is not None else None
         if address and not address.startswith("Select") and "wallet" not in address.lower():
             self.root.clipboard_clear()
             self.root.clipboard_append(address)
@@ -2035,10 +2774,10 @@ class ModernXRPWalletGUI:
             messagebox.showinfo("Info", "Select a wallet to copy its address")
 
     def refresh_receive_qr(self):
-        if not hasattr(self, "receive_last_address") or not self.receive_last_address:
+        if not self.receive_last_address:
             self.update_status("No wallet selected for QR")
             return
-        self.receive_qr_cache.pop(self.receive_last_address, None)
+        self.receive_qr_cache.pop((self.receive_last_address, QR_SIZE_PX), None)
         self.update_receive_tab(self.receive_last_address)
 
     def open_in_explorer(self):
@@ -2054,18 +2793,24 @@ class ModernXRPWalletGUI:
             return
 
         try:
-            webbrowser.open(url)
+            self._open_url(url)
             self.update_status("Opened explorer")
         except Exception as exc:
             messagebox.showerror("Explorer Error", f"Could not open explorer:\n{exc}")
 
+    def _open_url(self, url: str):
+        # Resolve the platform browser controller once instead of on every open()
+        if self._browser is None:
+            self._browser = webbrowser.get()
+        self._browser.open(url)
+
     def open_address_book(self):
         dialog = AddressBookDialog(self.root, self.multi_wallet)
         self.root.wait_window(dialog.dialog)
         if dialog.result:
             entry = dialog.result
             self.dest_var.set(entry.get("address", ""))
-            if hasattr(self, "dest_tag_var"):
+            if self.dest_tag_var is not None:
                 self.dest_tag_var.set(entry.get("destination_tag", ""))  # type: ignore[attr-defined]
 
     def export_secrets_dialog(self):
@@ -2084,6 +2829,12 @@ class ModernXRPWalletGUI:
         if password is None:
             return
 
+        # Make sure the store on disk reflects every queued change before re-reading it
+        try:
+            self.multi_wallet.flush_pending_saves()
+        except Exception as exc:
+            messagebox.showerror("Export Secrets", f"Wallet changes could not be saved:\n{exc}")
+            return
         secure_manager = MultiWalletManager()
         try:
             secure_manager.initialize(password)
@@ -2147,7 +2898,7 @@ class ModernXRPWalletGUI:
 
         destination = self.dest_var.get().strip()
         amount = self.amount_var.get().strip()
-        dest_tag_raw = self.dest_tag_var.get().strip() if hasattr(self, "dest_tag_var") else ""
+        dest_tag_raw = self.dest_tag_var.get().strip() if self.dest_tag_var is not None else ""
         memo = self.memo_var.get().strip()
 
         if not destination or not amount:
@@ -2171,14 +2922,10 @@ class ModernXRPWalletGUI:
 
         dest_tag_value = None
         if dest_tag_raw:
-            if not dest_tag_raw.isdigit():
-                messagebox.showerror("Error", "Destination tag must be a positive integer")
-                return
-            dest_tag_int = int(dest_tag_raw)
-            if not (0 <= dest_tag_int <= 2 ** 32 - 1):
+            dest_tag_value = _parse_destination_tag(dest_tag_raw)
+            if dest_tag_value is None:
                 messagebox.showerror("Error", "Destination tag must be between 0 and 2^32-1")
                 return
-            dest_tag_value = dest_tag_int
 
         def send_thread():
             status_message = ""
@@ -2204,41 +2951,59 @@ class ModernXRPWalletGUI:
                 result_payload = status_message
 
             def apply():
+                if success:
+                    # The payment may have moved funds between several local wallets
+                    self._balance_cache.clear()
+                if self.result_text is None:
+                    self.update_status(status_message)
+                    return
                 self.update_text_widget(self.result_text, result_payload)
                 if success:
                     self.dest_var.set("")
                     self.amount_var.set("")
-                    if hasattr(self, "dest_tag_var"):
+                    if self.dest_tag_var is not None:
                         self.dest_tag_var.set("")
                     self.memo_var.set("")
                     self.refresh_wallet_info()
-                    self.update_wallet_balances()
+                    self._request_balance_refresh()
                 self.update_status(status_message)
 
             self.run_on_ui_thread(apply)
 
-        threading.Thread(target=send_thread, daemon=True).start()
+        self._io_pool.submit(send_thread)
 
-    def refresh_history(self):
-        """Refresh transaction history"""
+    def refresh_history(self, more: bool = False):
+        """Refresh transaction history, or with more=True append the next page"""
         manager = self.multi_wallet.get_active_manager()
         if not manager or not manager.wallet:
             messagebox.showwarning("Warning", "No wallet selected")
             return
 
+        address = manager.wallet.address
+        marker = None
+        if more:
+            if self.history_address != address:
+                more = False  # Wallet changed since the last page; start over
+            elif self.history_marker is None:
+                self.history_status_var.set(f"All {len(self.history_records)} transactions loaded")
+                return
+            else:
+                marker = self.history_marker
+
+        try:
+            limit = int(self.limit_var.get())
+            if limit <= 0:
+                raise ValueError
+        except ValueError:
+            limit = HISTORY_PAGE_SIZE
+            self.limit_var.set(str(HISTORY_PAGE_SIZE))
+
         def history_thread():
             status_message = ""
             entries: List[Dict] = []
+            next_marker = None
             try:
-                try:
-                    limit = int(self.limit_var.get())
-                    if limit <= 0:
-                        raise ValueError
-                except ValueError:
-                    limit = 20
-                    self.run_on_ui_thread(lambda: self.limit_var.set("20"))
-
-                transactions = manager.get_transaction_history(limit=limit)
+                transactions, next_marker = manager.get_transaction_page(limit=limit, marker=marker)
 
                 valid_entries: List[Dict] = []
                 errors: List[str] = []
@@ -2262,55 +3027,109 @@ class ModernXRPWalletGUI:
                     amount = str(raw_amount)
                     if amount != "N/A" and not amount.upper().endswith("XRP") and " " not in amount:
                         amount = f"{amount} XRP"
+                    try:
+                        amount_value: Optional[float] = float(amount.split()[0])
+                    except (ValueError, IndexError):
+                        amount_value = None
                     fee = tx.get("fee") or "0"
                     destination = tx.get("destination") or ""
                     dest_tag = tx.get("destination_tag")
-                    direction = "Outgoing" if tx.get("account") == manager.wallet.address else "Incoming"
+                    direction = "Outgoing" if tx.get("account") == address else "Incoming"
+                    tx_type = tx.get("type", "")
+                    status = "Validated" if tx.get("validated") else "Pending"
+                    hash_short = tx_hash if len(tx_hash) <= 21 else tx_hash[:18] + "..."
 
                     valid_entries.append({
                         "hash": tx_hash,
-                        "type": tx.get("type", ""),
+                        "type": tx_type,
                         "direction": direction,
                         "amount": amount,
+                        "amount_value": amount_value,
                         "fee": fee,
                         "date": date_str,
-                        "status": "Validated" if tx.get("validated") else "Pending",
+                        "status": status,
+                        # Treeview row, built here so the Tk thread only inserts it
+                        "display_values": (hash_short, tx_type, direction, amount, date_str, status),
                         "destination": destination,
                         "destination_tag": dest_tag,
                         "raw": tx,
+                        # Detail pane text, serialized here rather than on every row click
+                        "raw_json": json.dumps(tx, indent=2, default=str),
                     })
 
                 entries = valid_entries
                 if errors and not entries:
                     status_message = f"History error: {errors[0]}"
-                else:
-                    status_message = f"Loaded {len(entries)} transactions"
             except Exception as exc:
                 status_message = f"Error loading history: {exc}"
 
             def apply():
-                self.history_records = entries
-                self.history_status_var.set(status_message)
-                self.history_list.delete(*self.history_list.get_children())
-                for entry in entries:
-                    self.history_list.insert(
-                        "",
-                        "end",
-                        iid=entry["hash"],
-                        values=(
-                            entry["hash"][:18] + "..." if len(entry["hash"]) > 21 else entry["hash"],
-                            entry["type"],
-                            entry["direction"],
-                            entry["amount"],
-                            entry["date"],
-                            entry["status"],
-                        ),
+                if self.history_list is None:
+                    return  # History tab closed while loading
+                if more and self.history_address != address:
+                    return  # A refresh for another wallet replaced this page's list
+                if more:
+                    # Append the page; earlier pages are neither refetched nor re-rendered
+                    shown_all = self.history_rendered == len(self.history_records)
+                    new_entries = [e for e in entries if e["hash"] not in self.history_index]
+                    self.history_records.extend(new_entries)
+                    self.history_index.update((e["hash"], e) for e in new_entries)
+                    if shown_all:
+                        self.history_rendered += min(len(new_entries), HISTORY_RENDER_CHUNK)
+                    self.history_marker = next_marker
+                else:
+                    records = entries
+                    index = {entry["hash"]: entry for entry in entries}
+                    marker_after = next_marker
+                    if (
+                        self.history_address == address
+                        and self.history_marker is not None
+                        and any(tx_hash in self.history_index for tx_hash in index)
+                    ):
+                        # The first page overlaps what is loaded: keep the older pages
+                        # behind it (and their marker) rather than dropping them
+                        older = [e for e in self.history_records if e["hash"] not in index]
+                        records = entries + older
+                        index.update((e["hash"], e) for e in older)
+                        marker_after = self.history_marker
+                    self.history_records = records
+                    self.history_index = index
+                    self.history_marker = marker_after
+                    # Keep however far the user had scrolled, but start with at least one chunk
+                    self.history_rendered = min(
+                        len(records), max(self.history_rendered, HISTORY_RENDER_CHUNK)
                     )
-                self.update_history_summary(entries)
+                self.history_address = address
+                self.history_status_var.set(
+                    status_message or f"Loaded {len(self.history_records)} transactions"
+                    + (" (more available)" if self.history_marker is not None else "")
+                )
+
+                self._render_history_rows()
+                self.update_history_summary(self.history_records)
 
             self.run_on_ui_thread(apply)
 
-        threading.Thread(target=history_thread, daemon=True).start()
+        self._io_pool.submit(history_thread)
+
+    def load_more_history(self):
+        self.refresh_history(more=True)
+
+    def _render_history_rows(self):
+        """Show the first history_rendered records in the history Treeview."""
+        self._sync_tree(self.history_list, [
+            (entry["hash"], entry["display_values"])
+            for entry in itertools.islice(self.history_records, self.history_rendered)
+        ])
+
+    def _on_history_yscroll(self, first: str, last: str):
+        self.history_scroll.set(first, last)
+        # Near the bottom of what is rendered: append the next chunk of records
+        if float(last) >= 0.9 and self.history_rendered < len(self.history_records):
+            self.history_rendered = min(
+                len(self.history_records), self.history_rendered + HISTORY_RENDER_CHUNK
+            )
+            self._render_history_rows()
 
     def update_history_summary(self, entries: List[Dict]):
         if not entries:
@@ -2321,12 +3140,11 @@ class ModernXRPWalletGUI:
         total_out = 0.0
         incoming = outgoing = 0
         for entry in entries:
-            amount_str = entry.get("amount", "0")
-            try:
-                value = float(amount_str.split()[0])
-            except Exception:
+            # Parsed once by the history worker; None when the amount is not numeric
+            value = entry["amount_value"]
+            if value is None:
                 continue
-            if entry.get("direction") == "Incoming":
+            if entry["direction"] == "Incoming":
                 total_in += value
                 incoming += 1
             else:
@@ -2344,14 +3162,10 @@ class ModernXRPWalletGUI:
         if not selection:
             return
         tx_hash = selection[0]
-        record = next((r for r in self.history_records if r.get("hash") == tx_hash), None)
+        record = self.history_index.get(tx_hash)
         if not record:
             return
-        details = json.dumps(record.get("raw", record), indent=2, default=str)
-        self.history_detail_text.config(state="normal")
-        self.history_detail_text.delete("1.0", tk.END)
-        self.history_detail_text.insert("1.0", details)
-        self.history_detail_text.config(state="disabled")
+        self.update_text_widget(self.history_detail_text, record["raw_json"])
 
     def copy_selected_hash(self):
         selection = self.history_list.selection()
@@ -2372,9 +3186,9 @@ class ModernXRPWalletGUI:
         active = self.multi_wallet.get_active_wallet()
         if not active:
             return
-        base = "https://livenet.xrpl.org/transactions/" if active.network == "mainnet" else "https://testnet.xrpl.org/transactions/"
+        template = EXPLORER_TX_URLS.get(active.network, DEFAULT_EXPLORER_TX_URL)
         try:
-            webbrowser.open(base + tx_hash)
+            self._open_url(template.format(tx_hash))
             self.update_status("Opened transaction in explorer")
         except Exception as exc:
             messagebox.showerror("Explorer", f"Could not open explorer:\n{exc}")
@@ -2443,7 +3257,7 @@ class ModernXRPWalletGUI:
 
             self.run_on_ui_thread(apply)
 
-        threading.Thread(target=create_thread, daemon=True).start()
+        self._io_pool.submit(create_thread)
 
     def load_transaction(self):
         """Load transaction from file"""
@@ -2524,20 +3338,24 @@ class ModernXRPWalletGUI:
 
             self.run_on_ui_thread(apply)
 
-        threading.Thread(target=sign_thread, daemon=True).start()
+        self._io_pool.submit(sign_thread)
 
     def update_text_widget(self, widget, text):
         """Update text widget content"""
+        if widget.get("1.0", "end-1c") == text:
+            return
         widget.config(state="normal")
-        widget.delete("1.0", tk.END)
-        widget.insert("1.0", text)
+        widget.replace("1.0", tk.END, text)
         widget.config(state="disabled")
 
     def _process_ui_queue(self):
         """Execute callbacks enqueued from background threads."""
+        drained = 0
         try:
-            while True:
+            # Bounded per tick so a burst of results cannot starve Tk's own events
+            while drained < UI_QUEUE_BATCH:
                 callback, args, kwargs = self.ui_queue.get_nowait()
+                drained += 1
                 try:
                     callback(*args, **kwargs)
                 except Exception as exc:
@@ -2545,7 +3363,45 @@ class ModernXRPWalletGUI:
         except Empty:
             pass
         finally:
-            self.root.after(50, self._process_ui_queue)
+            # Poll quickly while results are flowing, slowly once the queue goes quiet
+            self.root.after(UI_QUEUE_BUSY_MS if drained else UI_QUEUE_IDLE_MS, self._process_ui_queue)
+
+    def _request_list_refresh(self):
+        """Schedule one wallet list refresh for when Tk is next idle."""
+        if not self._list_refresh_pending:
+            self._list_refresh_pending = True
+            self.root.after_idle(self._do_list_refresh)
+
+    def _do_list_refresh(self):
+        self._list_refresh_pending = False
+        # The welcome screen may have been replaced since the request was made
+        if self.wallet_list_frame.winfo_exists():
+            self.refresh_wallet_list()
+
+    def _debounce(self, key: str, delay_ms: int, callback):
+        """Run callback delay_ms after the last request made under key."""
+        pending = self._debounce_ids.get(key)
+        if pending is not None:
+            self.root.after_cancel(pending)
+
+        def fire():
+            del self._debounce_ids[key]
+            callback()
+
+        self._debounce_ids[key] = self.root.after(delay_ms, fire)
+
+    def _request_balance_refresh(self):
+        """Schedule one balance refresh once requests stop arriving."""
+        self._debounce("balances", REFRESH_DEBOUNCE_MS, self.update_wallet_balances)
+
+    def _request_multisig_refresh(self):
+        """Schedule one signer-list refresh once requests stop arriving."""
+        self._debounce("multisig", REFRESH_DEBOUNCE_MS, self._do_multisig_refresh)
+
+    def _do_multisig_refresh(self):
+        # The wallet interface may have been torn down while the timer was pending
+        if self.multisig_status_tree is not None:
+            self.refresh_multisig_status()
 
     def run_on_ui_thread(self, callback, *args, **kwargs):
         """Schedule a callable to run on the Tk main loop."""
@@ -2678,10 +3534,10 @@ class AddressEntryDialog:
         if not label:
             messagebox.showerror("Validation", "Please provide a label")
             return
-        if not address or not address.startswith("r"):
+        if not address or not is_valid_classic_address(address):
             messagebox.showerror("Validation", "Please provide a valid XRP address")
             return
-        if tag and (not tag.isdigit() or not (0 <= int(tag) <= 2 ** 32 - 1)):
+        if tag and _parse_destination_tag(tag) is None:
             messagebox.showerror("Validation", "Destination tag must be a number between 0 and 2^32-1")
             return
 
@@ -2758,11 +3614,12 @@ class SignerEntryDialog:
         tag = self.tag_var.get().strip()
         weight_str = self.weight_var.get().strip() or "1"
 
-        if not address or not address.startswith('r'):
+        if not address or not is_valid_classic_address(address):
             messagebox.showerror("Validation", "Enter a valid XRP Classic address", parent=self.dialog)
             return
-        if tag and not tag.isdigit():
-            messagebox.showerror("Validation", "Destination tag must be numeric", parent=self.dialog)
+        if tag and _parse_destination_tag(tag) is None:
+            messagebox.showerror("Validation", "Destination tag must be a number between 0 and 2^32-1",
+                                 parent=self.dialog)
             return
         if not weight_str.isdigit() or int(weight_str) <= 0:
             messagebox.showerror("Validation", "Weight must be a positive integer", parent=self.dialog)
@@ -2785,6 +3642,8 @@ class AddressBookDialog:
     def __init__(self, parent, manager: MultiWalletManager):
         self.manager = manager
         self.result: Optional[Dict[str, str]] = None
+        # Snapshot of the address book; dropped whenever this dialog changes it
+        self._entries_cache: Optional[List[Dict[str, Optional[str]]]] = None
         self.dialog = tk.Toplevel(parent)
         self.dialog.title("Address Book")
         self.dialog.geometry("520x360")
@@ -2817,13 +3676,21 @@ class AddressBookDialog:
 
         self.refresh_list()
 
+    def _entries(self) -> List[Dict[str, Optional[str]]]:
+        if self._entries_cache is None:
+            self._entries_cache = self.manager.get_address_book()
+        return self._entries_cache
+
     def refresh_list(self):
-        self.listbox.delete(0, tk.END)
-        for entry in self.manager.get_address_book():
+        items = []
+        for entry in self._entries():
             label = entry.get("label", "")
             address = entry.get("address", "")
             display_address = f"{address[:12]}..." if len(address) > 15 else address
-            self.listbox.insert(tk.END, f"{label} — {display_address}")
+            items.append(f"{label} — {display_address}")
+        self.listbox.delete(0, tk.END)
+        # One Tcl call for the whole list
+        self.listbox.insert(tk.END, *items)
 
     def get_selected_index(self) -> Optional[int]:
         selection = self.listbox.curselection()
@@ -2835,7 +3702,7 @@ class AddressBookDialog:
         idx = self.get_selected_index()
         if idx is None:
             return
-        entries = self.manager.get_address_book()
+        entries = self._entries()
         if 0 <= idx < len(entries):
             self.result = entries[idx]
             self.dialog.destroy()
@@ -2849,13 +3716,14 @@ class AddressBookDialog:
                 dialog.result["address"],
                 dialog.result.get("destination_tag"),
             )
+            self._entries_cache = None
             self.refresh_list()
 
     def edit_entry(self):
         idx = self.get_selected_index()
         if idx is None:
             return
-        entries = self.manager.get_address_book()
+        entries = self._entries()
         if not (0 <= idx < len(entries)):
             return
         dialog = AddressEntryDialog(self.dialog, "Edit Address", initial=entries[idx])
@@ -2867,6 +3735,7 @@ class AddressBookDialog:
                 dialog.result.get("destination_tag"),
                 index=idx,
             )
+            self._entries_cache = None
             self.refresh_list()
 
     def delete_entry(self):
@@ -2875,14 +3744,17 @@ class AddressBookDialog:
             return
         if messagebox.askyesno("Delete", "Remove this address from the address book?"):
             self.manager.remove_contact(idx)
+            self._entries_cache = None
             self.refresh_list()
 
 
 class WalletDialog:
-    """Dialog for adding a new wallet"""
+    """Dialog collecting a wallet name, secret and network"""
 
-    def __init__(self, parent, title="Add Wallet"):
+    def __init__(self, parent, title="Add Wallet", submit_text="Add Wallet"):
         self.result = None
+        self.title = title
+        self.submit_text = submit_text
 
         # Create dialog window
         self.dialog = tk.Toplevel(parent)
@@ -2906,7 +3778,7 @@ class WalletDialog:
         main_frame.pack(fill="both", expand=True)
 
         # Title
-        ttk.Label(main_frame, text="Add New Wallet",
+        ttk.Label(main_frame, text=self.title,
                  font=ModernStyle.FONT_LARGE).pack(pady=(0, 20))
 
         # Wallet name
@@ -2943,7 +3815,7 @@ class WalletDialog:
 
         ttk.Button(button_frame, text="Cancel",
                   command=self.cancel).pack(side="right", padx=(10, 0))
-        ttk.Button(button_frame, text="Add Wallet",
+        ttk.Button(button_frame, text=self.submit_text,
                   command=self.add_wallet).pack(side="right")
 
         # Focus on name entry
@@ -2985,6 +3857,14 @@ def main():
 
     app = ModernXRPWalletGUI(root)
     root.mainloop()
+    app._io_pool.shutdown(wait=False, cancel_futures=True)
+    app._balance_pool.shutdown(wait=False, cancel_futures=True)
+    if app._qr_session is not None:
+        app._qr_session.close()
+    try:
+        app.multi_wallet.flush_pending_saves()
+    except Exception as exc:
+        raise SystemExit(f"Failed to save wallet changes before exit: {exc}") from exc
 
 
 if __name__ == "__main__":
@@ -22,6 +22,7 @@ from ecpy.keys import ECPrivateKey
 
 from xrpl.clients import JsonRpcClient
 from xrpl.constants import CryptoAlgorithm
+from xrpl.core.addresscodec import is_valid_classic_address
 from xrpl.wallet import Wallet, generate_faucet_wallet
 from xrpl.models.transactions import Memo, Payment, SignerListSet
 from xrpl.models.requests import AccountInfo, AccountTx, ServerInfo, AccountObjects, GenericRequest
@@ -33,6 +34,8 @@ from xrpl.core.keypairs import secp256k1 as secp_impl
 
 
 HEX_PATTERN = re.compile(r"^[0-9A-F]+$")
+# Classic address shape: 'r' followed by the XRPL base58 alphabet, 25-34 chars total
+CLASSIC_ADDRESS_PATTERN = re.compile(r"^r[1-9A-HJ-NP-Za-km-z]{24,33}$")
 
 
 @dataclass
@@ -273,6 +276,12 @@ class XRPWalletManager:
 
     def get_transaction_history(self, address: Optional[str] = None, limit: int = 20) -> List[Dict]:
         """Get transaction history for an account"""
+        return self.get_transaction_page(address, limit)[0]
+
+    def get_transaction_page(
+        self, address: Optional[str] = None, limit: int = 20, marker: Optional[object] = None
+    ) -> Tuple[List[Dict], Optional[object]]:
+        """Get one page of transaction history and the marker for the next page (None at the end)"""
         account = address or self.wallet.address
 
         try:
@@ -283,6 +292,7 @@ class XRPWalletManager:
                 ledger_index_max=-1,
                 forward=False,
                 binary=False,
+                marker=marker,
             )
             response = self.client.request(account_tx)
 
@@ -320,23 +330,24 @@ class XRPWalletManager:
                         'validated': tx.get('validated', False),
                         'raw': tx,
                     })
-                if transactions:
-                    return transactions
+                if transactions or marker is not None:
+                    return transactions, response.result.get('marker')
                 fallback = self._fetch_history_fallback(account, limit)
                 if fallback is not None:
-                    return fallback
-                return transactions
+                    return fallback, None
+                return transactions, None
             else:
-                fallback = self._fetch_history_fallback(account, limit)
+                # The explorer fallbacks cannot continue from an account_tx marker
+                fallback = self._fetch_history_fallback(account, limit) if marker is None else None
                 if fallback is not None:
-                    return fallback
-                return [{'error': response.result.get('error_message', 'Unknown error')}]
+                    return fallback, None
+                return [{'error': response.result.get('error_message', 'Unknown error')}], None
 
         except Exception as e:
-            fallback = self._fetch_history_fallback(account, limit)
+            fallback = self._fetch_history_fallback(account, limit) if marker is None else None
             if fallback is not None:
-                return fallback
-            return [{'error': str(e)}]
+                return fallback, None
+            return [{'error': str(e)}], None
 
     def _fetch_history_fallback(self, account: str, limit: int) -> Optional[List[Dict]]:
         if self.network != 'mainnet':
@@ -648,24 +659,10 @@ class XRPWalletManager:
             return {'error': str(e)}
 
     def validate_address(self, address: str) -> bool:
-        """Validate XRP address format"""
-        try:
-            # Basic validation - XRP addresses start with 'r' and are typically 25-34 characters
-            if not address.startswith('r'):
-                return False
-            if len(address) < 25 or len(address) > 34:
-                return False
-
-            # Try to get account info - if it exists, address is valid
-            # If it doesn't exist, we'll get a specific error
-            account_info = AccountInfo(account=address)
-            response = self.client.request(account_info)
-
-            # Even if account doesn't exist, the address format could be valid
-            return True
-
-        except Exception:
+        """Validate XRP address format and checksum (offline)"""
+        if not isinstance(address, str) or not CLASSIC_ADDRESS_PATTERN.fullmatch(address):
             return False
+        return is_valid_classic_address(address)
 
     def get_signer_list(self, account: Optional[str] = None) -> Dict:
         acct = account or (self.wallet.address if self.wallet else None)
@@ -695,8 +692,8 @@ class XRPWalletManager:
         except Exception as exc:
             return {'enabled': False, 'error': str(exc)}
 
-    def estimate_signer_list_cost(self, signer_count: int) -> Dict:
-        info = self.get_network_info()
+    def estimate_signer_list_cost(self, signer_count: int, network_info: Optional[Dict] = None) -> Dict:
+        info = network_info if network_info is not None else self.get_network_info()
         reserve_base = Decimal(str(info.get('reserve_base', 0)))
         reserve_inc = Decimal(str(info.get('reserve_inc', 0)))
         additional = reserve_inc * Decimal(max(signer_count, 0))